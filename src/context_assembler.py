@@ -9,14 +9,16 @@ compatibility path, but canonical task data is preferred whenever available.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import tempfile
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse
 
+from src.hive.common import isoformat_z
+from src.hive.context_bundle import generate_file_tree as render_file_tree
 from src.hive.memory.context import startup_context
 from src.hive.models.task import TaskRecord
 from src.hive.scheduler.query import ready_tasks as scheduler_ready_tasks
@@ -40,27 +42,7 @@ def generate_file_tree(
     Returns:
         String representation of file tree
     """
-    if current_depth >= max_depth:
-        return ""
-
-    tree = ""
-    try:
-        items = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-        items = [i for i in items if not i.name.startswith(".") and i.name != "__pycache__"]
-
-        for index, item in enumerate(items):
-            is_last = index == len(items) - 1
-            current_prefix = "└── " if is_last else "├── "
-            tree += f"{prefix}{current_prefix}{item.name}\n"
-
-            if item.is_dir() and current_depth < max_depth - 1:
-                extension = "    " if is_last else "│   "
-                tree += generate_file_tree(item, prefix + extension, max_depth, current_depth + 1)
-
-    except PermissionError:
-        pass
-
-    return tree
+    return render_file_tree(directory, prefix, max_depth, current_depth)
 
 
 def clone_external_repo(url: str, branch: str = "main") -> Optional[Path]:
@@ -124,14 +106,21 @@ def get_external_repo_context(
         Tuple of (file_tree, key_files_content)
     """
 
+    noise = {"node_modules", "__pycache__", "dist", "build", ".git", ".venv", "venv"}
+
     def filtered_tree(directory: Path, prefix: str = "", depth: int = 0, max_depth: int = 4) -> str:
         if depth >= max_depth:
             return ""
         result = ""
         try:
-            items = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-            noise = {"node_modules", "__pycache__", "dist", "build", ".git", ".venv", "venv"}
-            items = [i for i in items if not i.name.startswith(".") and i.name not in noise]
+            # Drop hidden and noise entries before sorting so we never sort what we discard.
+            with os.scandir(directory) as entries:
+                items = [
+                    entry
+                    for entry in entries
+                    if not entry.name.startswith(".") and entry.name not in noise
+                ]
+            items.sort(key=lambda entry: (not entry.is_dir(), entry.name))
 
             for index, item in enumerate(items):
                 is_last = index == len(items) - 1
@@ -140,7 +129,7 @@ def get_external_repo_context(
                 if item.is_dir():
                     extension = "    " if is_last else "│   "
                     result += filtered_tree(
-                        item,
+                        Path(item.path),
                         prefix + extension,
                         depth + 1,
                         max_depth,
@@ -572,7 +561,7 @@ When you complete your work:
 4. Link the PR or leave a clear handoff note in the canonical task
 
 ---
-*Generated by Agent Hive Dispatcher at {datetime.now(timezone.utc).isoformat()}*
+*Generated by Agent Hive Dispatcher at {isoformat_z(timespec="seconds")}*
 """
     return body
 
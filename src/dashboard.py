@@ -9,27 +9,20 @@ depending on Streamlit.
 
 from __future__ import annotations
 
-import glob
 import logging
 import os
 from pathlib import Path
 
-from src.hive.console.state import (
-    build_home_view as build_console_home_view,
-    build_inbox as build_console_inbox,
-    list_runs as list_console_runs,
-    load_run_detail as load_console_run_detail,
-    load_run_timeline as load_console_run_timeline,
-)
-from src.hive.context_bundle import build_context_bundle, generate_file_tree as render_file_tree
-from src.hive.scheduler.query import ready_tasks
-from src.hive.workspace import sync_workspace
-from src.security import safe_dump_agency_md, safe_load_agency_md
+from src.security import safe_load_agency_md
+
+# The console, scheduler, and context-bundle stacks are imported inside the
+# helpers that need them so `load_project`/`discover_projects` stay cheap to import.
+# pylint: disable=import-outside-toplevel
 
 LOGGER = logging.getLogger(__name__)
 
 
-def load_project(project_path: str):
+def load_project(project_path: str | Path):
     """Load and parse an AGENCY.md file using safe YAML loading."""
     try:
         parsed = safe_load_agency_md(Path(project_path))
@@ -37,20 +30,17 @@ def load_project(project_path: str):
         LOGGER.debug("Unable to load project %s: %s", project_path, exc)
         return None
     return {
-        "path": project_path,
+        "path": str(project_path),
         "metadata": parsed.metadata,
         "content": parsed.content,
-        "raw": safe_dump_agency_md(parsed.metadata, parsed.content),
+        # The parser already kept the file text; re-dumping the YAML would only echo it.
+        "raw": parsed.raw,
     }
 
 
 def discover_projects(base_path: Path):
     """Find all AGENCY.md files in the projects directory."""
-    projects_dir = base_path / "projects"
-    if not projects_dir.exists():
-        return []
-
-    agency_files = glob.glob(str(projects_dir / "**" / "AGENCY.md"), recursive=True)
+    agency_files = (base_path / "projects").glob("**/AGENCY.md")
     projects = [project for path in agency_files if (project := load_project(path))]
     return sorted(projects, key=lambda item: item["metadata"].get("project_id", ""))
 
@@ -59,21 +49,33 @@ def generate_file_tree(
     directory: Path, prefix: str = "", max_depth: int = 3, current_depth: int = 0
 ):
     """Generate a text-based file tree."""
+    from src.hive.context_bundle import generate_file_tree as render_file_tree
+
     return render_file_tree(directory, prefix, max_depth, current_depth)
 
 
-def generate_deep_work_context(project_path: str, base_path: Path):
-    """Generate a v2 startup context package for focused work sessions."""
-    return generate_hive_context(project_path, base_path, mode="startup", profile="light")
+def generate_deep_work_context(project_path: str, base_path: Path, *, project: dict | None = None):
+    """Generate a v2 startup context package for focused work sessions.
+
+    Pass an already-loaded ``project`` dict from ``discover_projects`` or
+    ``load_project`` to skip re-reading AGENCY.md.
+    """
+    return generate_hive_context(
+        project_path, base_path, mode="startup", profile="light", project=project
+    )
 
 
 def list_project_ready_tasks(base_path: Path, project_id: str, limit: int = 10):
     """Return canonical ready tasks for a single project."""
+    from src.hive.scheduler.query import ready_tasks
+
     return ready_tasks(base_path, project_id=project_id, limit=limit)
 
 
 def sync_hive_views(base_path: Path):
     """Refresh generated projections and the derived cache."""
+    from src.hive.workspace import sync_workspace
+
     sync_workspace(base_path)
 
 
@@ -85,26 +87,36 @@ def list_runs(
     health: str | None = None,
 ) -> list[dict]:
     """Return normalized runs for the observe console."""
+    from src.hive.console.state import list_runs as list_console_runs
+
     return list_console_runs(base_path, project_id=project_id, driver=driver, health=health)
 
 
 def load_run_timeline(base_path: Path, run_id: str) -> list[dict]:
     """Load a per-run event timeline, falling back to the global audit log."""
+    from src.hive.console.state import load_run_timeline as load_console_run_timeline
+
     return load_console_run_timeline(base_path, run_id)
 
 
 def build_inbox(base_path: Path) -> list[dict]:
     """Return typed attention items for the operator inbox."""
+    from src.hive.console.state import build_inbox as build_console_inbox
+
     return build_console_inbox(base_path)
 
 
 def build_home_view(base_path: Path) -> dict:
     """Answer the five core operator questions from one payload."""
+    from src.hive.console.state import build_home_view as build_console_home_view
+
     return build_console_home_view(base_path)
 
 
 def load_run_detail(base_path: Path, run_id: str) -> dict:
     """Return the detail payload for a single run."""
+    from src.hive.console.state import load_run_detail as load_console_run_detail
+
     return load_console_run_detail(base_path, run_id)
 
 
@@ -114,12 +126,15 @@ def generate_hive_context(
     *,
     mode: str = "startup",
     profile: str = "light",
+    project: dict | None = None,
 ):
     """Generate a formatted Hive v2 startup or handoff context."""
-    project_data = load_project(project_path)
+    project_data = project if project is not None else load_project(project_path)
     if not project_data:
         return None
 
+    from src.hive.context_bundle import build_context_bundle
+
     project_id = project_data["metadata"].get("project_id", "unknown")
     try:
         bundle = build_context_bundle(
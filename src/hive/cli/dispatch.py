@@ -1,18 +1,19 @@
 """Top-level dispatch for Hive CLI commands."""
 
 # pylint: disable=line-too-long,too-many-lines,too-many-locals,too-many-statements
-# pylint: disable=too-many-branches,too-many-return-statements
+# pylint: disable=too-many-branches,too-many-return-statements,import-outside-toplevel
 
 from __future__ import annotations
 
 from pathlib import Path
 
-from src.hive.cli import bootstrap, control, knowledge, project, run
-
 
 def dispatch(args, root: Path) -> int:
     """Route the parsed CLI args to the appropriate command family."""
+    # Each family pulls in a different slice of the runtime, so import only the one in use.
     if args.command in {"quickstart", "init", "onboard", "adopt", "doctor"}:
+        from src.hive.cli import bootstrap
+
         return bootstrap.dispatch(args, root)
     if args.command in {
         "next",
@@ -28,10 +29,16 @@ def dispatch(args, root: Path) -> int:
         "sandbox",
         "integrate",
     }:
+        from src.hive.cli import control
+
         return control.dispatch(args, root)
     if args.command in {"project", "workspace", "task"}:
+        from src.hive.cli import project
+
         return project.dispatch(args, root)
     if args.command in {"run", "steer", "program"}:
+        from src.hive.cli import run
+
         return run.dispatch(args, root)
     if args.command in {
         "memory",
@@ -43,5 +50,7 @@ def dispatch(args, root: Path) -> int:
         "campaign",
         "brief",
     }:
+        from src.hive.cli import knowledge
+
         return knowledge.dispatch(args, root)
     return 0
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+from functools import lru_cache
 import json
+import os
+import stat
+import time
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Generic, TypeVar
 
 
 HIVE_VERSION = "2.4.0"
 
+_T = TypeVar("_T")
+
 MARKER_PROJECTS_BEGIN = "<!-- hive:begin projects -->"
 MARKER_PROJECTS_END = "<!-- hive:end projects -->"
 MARKER_TASK_ROLLUP_BEGIN = "<!-- hive:begin task-rollup -->"
@@ -26,10 +33,10 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def isoformat_z(value: datetime | None = None) -> str:
+def isoformat_z(value: datetime | None = None, *, timespec: str = "auto") -> str:
     """Format a datetime as a compact UTC timestamp."""
     timestamp = value or utc_now()
-    return timestamp.isoformat().replace("+00:00", "Z")
+    return timestamp.isoformat(timespec=timespec).replace("+00:00", "Z")
 
 
 def ensure_directory(path: Path) -> Path:
@@ -51,6 +58,55 @@ def dump_json(path: Path, payload: Any) -> None:
     path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
+def write_text_atomic(
+    path: Path, text: str, *, invalidate: Callable[[], None] | None = None
+) -> None:
+    """Replace a text file atomically, then run ``invalidate`` to drop stale caches.
+
+    The write goes through symlinks to their target and keeps the existing file's
+    permission bits, so readers never observe a truncated or half-written file.
+    """
+    target = Path(os.path.realpath(path))
+    temp_path = target.with_name(f"{target.name}.tmp.{os.getpid()}.{time.time_ns()}")
+    try:
+        temp_path.write_text(text, encoding="utf-8")
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(target).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, target)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    if invalidate is not None:
+        invalidate()
+
+
+class StatCachedParser(Generic[_T]):
+    """Memoize a file parser while the file's mtime and size are unchanged on disk."""
+
+    def __init__(self, parse: Callable[[Path], _T], *, maxsize: int) -> None:
+        self._parse = parse
+        self._cached = lru_cache(maxsize=maxsize)(self._parse_keyed)
+
+    def _parse_keyed(self, path: str, mtime_ns: int, size: int) -> _T:
+        del mtime_ns, size  # The stat fields only key the cache.
+        return self._parse(Path(path))
+
+    def load(self, path: str | Path) -> _T:
+        """Return a parse of ``path``; callers get a deep copy they may mutate freely."""
+        info = os.stat(path)
+        return deepcopy(self._cached(str(path), info.st_mtime_ns, info.st_size))
+
+    def write(self, path: Path, text: str) -> None:
+        """Atomically replace ``path`` and forget every cached parse.
+
+        Clearing everything matters because a same-size rewrite within one mtime
+        tick would otherwise keep its old cache key.
+        """
+        write_text_atomic(path, text, invalidate=self._cached.cache_clear)
+
+
 def serialize_value(value: Any) -> Any:
     """Convert a value into a JSON-safe structure."""
     if is_dataclass(value):
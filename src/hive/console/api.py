@@ -575,8 +575,9 @@ def project_context(
     sync_workspace(root)
     try:
         project = get_project(root, project_ref)
+        # The workspace was synced above; skip the bundle's own full refresh.
         bundle = build_context_bundle(
-            root, project_ref=project.id, mode=mode, profile=profile
+            root, project_ref=project.id, mode=mode, profile=profile, refresh=False
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -1097,10 +1097,11 @@ def build_activity_feed(
     items.sort(key=lambda item: str(item.get("id") or ""))
     items.sort(key=lambda item: str(item.get("occurred_at") or ""), reverse=True)
     items.sort(key=lambda item: not bool(item.get("occurred_at")))
+    visible = items[:20]
     return {
-        "items": items[:20],
+        "items": visible,
         "summary": {
-            "total": len(items[:20]),
+            "total": len(visible),
         },
     }
 
@@ -1109,14 +1110,14 @@ def build_home_view(base_path: Path) -> dict:
     """Answer the five core operator questions from one payload."""
     status = portfolio_status(base_path)
     deps = dependency_summary(base_path)
-    inbox = build_inbox(base_path)
+    # list_runs refreshes driver state per run; load once and share it with the inbox.
+    runs = list_runs(base_path)
+    inbox = build_inbox(base_path, runs=runs)
     active_runs = list(status["active_runs"]) + [
         run for run in list_delegate_entries(base_path) if run.get("status") == "attached"
     ]
     active_runs.sort(key=lambda item: item.get("started_at") or item["id"], reverse=True)
-    accepted = [run for run in list_runs(base_path) if run.get("status") == "accepted"][
-        :5
-    ]
+    accepted = [run for run in runs if run.get("status") == "accepted"][:5]
     blocked_projects = [
         project
         for project in deps.get("projects", [])
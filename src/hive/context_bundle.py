@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from src.hive.common import isoformat_z
@@ -13,35 +14,84 @@ from src.hive.store.task_files import get_task
 from src.hive.workspace import sync_workspace
 from src.security import safe_dump_agency_md
 
+TREE_MAX_ENTRIES = 2000
+TREE_MAX_CHARS = 200_000
+TREE_TRUNCATED_MARKER = "...(truncated)\n"
+
+
+def _list_tree_entries(path: str) -> tuple[list[str], list[str]]:
+    """Return sorted visible directory and file names for one tree level."""
+    dirs: list[str] = []
+    files: list[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name == "__pycache__":
+                continue
+            if entry.is_dir():
+                dirs.append(name)
+            else:
+                files.append(name)
+    dirs.sort()
+    files.sort()
+    return dirs, files
+
 
 def generate_file_tree(
-    directory: Path, prefix: str = "", max_depth: int = 3, current_depth: int = 0
+    directory: Path,
+    prefix: str = "",
+    max_depth: int = 3,
+    current_depth: int = 0,
+    *,
+    max_entries: int = TREE_MAX_ENTRIES,
+    max_chars: int = TREE_MAX_CHARS,
 ) -> str:
-    """Generate a text file tree for a project directory."""
-    if current_depth >= max_depth:
-        return ""
+    """Generate a text file tree for a project directory.
+
+    Rendering stops with a truncation marker once either ``max_entries`` lines or
+    ``max_chars`` characters have been emitted, so huge projects cannot blow up
+    the startup context.
+    """
+    parts: list[str] = []
+    entries = 0
+    size = 0
+    # Each frame is (line to emit, directory to expand or None, child prefix, depth).
+    stack: list[tuple[str, str | None, str, int]] = [("", str(directory), prefix, current_depth)]
+    while stack:
+        line, path, branch_prefix, depth = stack.pop()
+        if line:
+            if entries >= max_entries or size + len(line) > max_chars:
+                parts.append(TREE_TRUNCATED_MARKER)
+                break
+            entries += 1
+            size += len(line)
+            parts.append(line)
+        if path is None or depth >= max_depth:
+            continue
+        try:
+            dirs, files = _list_tree_entries(path)
+        except PermissionError:
+            continue
 
-    tree = ""
-    try:
-        items = sorted(directory.iterdir(), key=lambda item: (not item.is_dir(), item.name))
-        items = [
-            item
-            for item in items
-            if not item.name.startswith(".") and item.name != "__pycache__"
-        ]
-
-        for index, item in enumerate(items):
-            is_last = index == len(items) - 1
+        children = [(name, True) for name in dirs] + [(name, False) for name in files]
+        last_index = len(children) - 1
+        # Push in reverse so siblings pop (and render) in sorted order.
+        for index in range(last_index, -1, -1):
+            name, is_dir = children[index]
+            is_last = index == last_index
             current_prefix = "└── " if is_last else "├── "
-            tree += f"{prefix}{current_prefix}{item.name}\n"
-
-            if item.is_dir() and current_depth < max_depth - 1:
-                extension = "    " if is_last else "│   "
-                tree += generate_file_tree(item, prefix + extension, max_depth, current_depth + 1)
-    except PermissionError:
-        pass
+            extension = "    " if is_last else "│   "
+            child_path = os.path.join(path, name) if is_dir and depth < max_depth - 1 else None
+            stack.append(
+                (
+                    f"{branch_prefix}{current_prefix}{name}\n",
+                    child_path,
+                    branch_prefix + extension,
+                    depth + 1,
+                )
+            )
 
-    return tree
+    return "".join(parts)
 
 
 def _render_ready_task_lines(
@@ -139,56 +189,35 @@ def build_context_bundle(
 ## CURRENT TASK
 
 {rendered_current_task}"""
-    rendered = f"""# HIVE {mode_label} CONTEXT
-# Project: {project.id}
-# Profile: {context.get('profile', profile)}
-# Target Tokens: {context.get('target_tokens', 'n/a')}
-# Generated: {isoformat_z()}
-
----
-
-## YOUR ROLE
-
-You are entering a Hive v2 {mode_label.lower()} session for **{project.id}**.
-Use canonical tasks, `PROGRAM.md`, and the assembled context below as the source of truth.
-
----
-
-## READY TASKS
-
-{_render_ready_task_lines(ready, current_task_id=task_id)}
-{current_task_section}
-
----
-
-## AGENCY.md
-
-```yaml
-{agency_document}
-```
-
----
-
-## HIVE CONTEXT
-
-{_render_context_sections(context)}
-
----
-
-## PROJECT FILE STRUCTURE
-
-{generate_file_tree(project_dir)}
-
----
-
-## HANDOFF PROTOCOL
-
-Before ending your session:
-1. Update the relevant canonical task in `.hive/tasks/`
-2. Sync projections if task state or notes changed: `hive sync projections`
-3. Release or transition the task appropriately in Hive
-4. Create a PR or leave a clear handoff note
-""".strip()
+    # Assemble once with join; literal edges carry no padding, so no full-copy strip().
+    parts = [
+        f"# HIVE {mode_label} CONTEXT\n",
+        f"# Project: {project.id}\n",
+        f"# Profile: {context.get('profile', profile)}\n",
+        f"# Target Tokens: {context.get('target_tokens', 'n/a')}\n",
+        f"# Generated: {isoformat_z(timespec='seconds')}\n",
+        "\n---\n\n## YOUR ROLE\n\n",
+        f"You are entering a Hive v2 {mode_label.lower()} session for **{project.id}**.\n",
+        "Use canonical tasks, `PROGRAM.md`, and the assembled context below"
+        " as the source of truth.\n",
+        "\n---\n\n## READY TASKS\n\n",
+        _render_ready_task_lines(ready, current_task_id=task_id),
+        "\n",
+        current_task_section,
+        "\n\n---\n\n## AGENCY.md\n\n```yaml\n",
+        agency_document,
+        "\n```\n\n---\n\n## HIVE CONTEXT\n\n",
+        _render_context_sections(context),
+        "\n\n---\n\n## PROJECT FILE STRUCTURE\n\n",
+        generate_file_tree(project_dir),
+        "\n\n---\n\n## HANDOFF PROTOCOL\n\n",
+        "Before ending your session:\n",
+        "1. Update the relevant canonical task in `.hive/tasks/`\n",
+        "2. Sync projections if task state or notes changed: `hive sync projections`\n",
+        "3. Release or transition the task appropriately in Hive\n",
+        "4. Create a PR or leave a clear handoff note",
+    ]
+    rendered = "".join(parts)
     return {
         "project": project,
         "project_payload": project_payload(project),
@@ -735,9 +735,11 @@ def tick_campaign(
         launch_decisions.append(decision)
         if selected["action"] != "launch":
             break
-    campaign.last_tick_at = utc_now_iso()
+    # One clock read so last_tick_at and updated_at agree exactly.
+    ticked_at = utc_now_iso()
+    campaign.last_tick_at = ticked_at
     campaign.next_tick_at = next_tick_at(campaign)
-    campaign.updated_at = utc_now_iso()
+    campaign.updated_at = ticked_at
     save_campaign(root, campaign)
     emit_event(
         root,
@@ -9,6 +9,7 @@ import getpass
 import json
 import os
 
+from src.hive.clock import utc_now_iso
 from src.hive.constants import RUN_ACTIVE_STATUSES
 from src.hive.context_bundle import build_context_bundle
 from src.hive.drivers import SteeringRequest
@@ -57,7 +58,7 @@ def _default_owner() -> str:
 
 
 def _iso_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return utc_now_iso()
 
 
 def _parse_iso(value: str | None) -> datetime | None:
@@ -84,22 +85,22 @@ def steering_state(project) -> dict[str, Any]:
     state = dict(STEERING_DEFAULTS)
     if isinstance(raw, dict):
         state.update(raw)
-    state["paused"] = bool(state.get("paused", False))
-    state["force_review"] = bool(state.get("force_review", False))
+    # Every key is seeded from STEERING_DEFAULTS, so plain indexing is safe here.
+    state["paused"] = bool(state["paused"])
+    state["force_review"] = bool(state["force_review"])
     try:
-        state["boost"] = int(state.get("boost", 0))
+        state["boost"] = int(state["boost"])
     except (TypeError, ValueError):
         state["boost"] = 0
-    focus_task_id = state.get("focus_task_id")
+    focus_task_id = state["focus_task_id"]
     state["focus_task_id"] = str(focus_task_id).strip() if focus_task_id else None
-    state["note"] = str(state.get("note", "")).strip()
-    state["updated_at"] = state.get("updated_at")
-    state["updated_by"] = state.get("updated_by")
+    state["note"] = str(state["note"]).strip()
     return state
 
 
 def _project_payload(project) -> dict[str, Any]:
-    payload = dict(project_payload(project))
+    # project_payload already returns a fresh dict, so extend it in place.
+    payload = project_payload(project)
     payload["steering"] = steering_state(project)
     return payload
 
@@ -323,6 +324,8 @@ def work_on_task(
             root,
             message=checkpoint_message or f"Checkpoint before starting {task_id}",
         )
+        # Commit hooks may touch the task file, so reload before claiming over it.
+        task = get_task(root, task_id)
     if task.owner and task.owner != resolved_owner:
         if task.status == "in_progress":
             raise ValueError(f"Task {task.id} is already in progress by {task.owner}.")
@@ -333,7 +336,7 @@ def work_on_task(
     if task.status in {"proposed", "ready"} or (
         task.status == "claimed" and task.owner == resolved_owner
     ):
-        task = claim_task(root, task.id, resolved_owner, ttl_minutes)
+        task = claim_task(root, task.id, resolved_owner, ttl_minutes, task=task)
         sync_workspace(root)
     run = start_run(
         root,
@@ -10,6 +10,8 @@ import shlex
 import sys
 from typing import Any
 
+from src.hive.common import write_text_atomic
+
 
 def _append_ndjson(path: Path, record: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -67,13 +69,16 @@ class ClaudeSDKBroker:
             "result": None,
             "error": None,
         }
+        self._written_state: str | None = None
 
     def _write_state(self) -> None:
+        text = json.dumps(self.state, indent=2, sort_keys=True)
+        # Polling SDK messages rarely changes the state, so only write real changes.
+        if text == self._written_state:
+            return
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(
-            json.dumps(self.state, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        write_text_atomic(self.state_path, text)
+        self._written_state = text
 
     def _write_exit_code(self, code: int) -> None:
         self.exit_code_path.parent.mkdir(parents=True, exist_ok=True)
@@ -229,11 +234,13 @@ class ClaudeSDKBroker:
         future: asyncio.Future[dict[str, Any]] = loop.create_future()
         self.pending_request_id = request_id
         self.pending_resolution_future = future
-        while not future.done():
-            await asyncio.sleep(0.1)
-        self.pending_request_id = None
-        self.pending_resolution_future = None
-        return future.result()
+        try:
+            # The channel watcher resolves the future on this loop; awaiting it wakes
+            # us as soon as it does instead of on the next polling tick.
+            return await future
+        finally:
+            self.pending_request_id = None
+            self.pending_resolution_future = None
 
     async def _can_use_tool(self, tool_name: str, input_data: dict[str, Any], context: Any):
         from claude_code_sdk import PermissionResultAllow, PermissionResultDeny
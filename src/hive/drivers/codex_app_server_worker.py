@@ -12,6 +12,8 @@ import sys
 import time
 from typing import Any
 
+from src.hive.common import write_text_atomic
+
 TERMINAL_TURN_STATUSES = {"completed", "interrupted", "cancelled", "failed"}
 
 
@@ -67,13 +69,16 @@ class CodexAppServerBroker:
             "token_usage": {},
             "last_message": None,
         }
+        self._written_state: str | None = None
 
     def _write_state(self) -> None:
+        text = json.dumps(self.state, indent=2, sort_keys=True)
+        # Most streamed events leave the state untouched; skip rewriting identical files.
+        if text == self._written_state:
+            return
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(
-            json.dumps(self.state, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        write_text_atomic(self.state_path, text)
+        self._written_state = text
 
     def _write_exit_code(self, code: int) -> None:
         self.exit_code_path.parent.mkdir(parents=True, exist_ok=True)
@@ -670,42 +670,44 @@ def import_hermes_trajectory(
     }
 
 
+_HERMES_EVENT_KIND_MAP = {
+    # Hermes native → Hive trajectory
+    "session.start": "session_start",
+    "session.end": "session_end",
+    "turn.start": "turn_start",
+    "turn.end": "turn_end",
+    "message": "user_message",
+    "user_message": "user_message",
+    "assistant": "assistant_delta",
+    "assistant_message": "assistant_delta",
+    "assistant_delta": "assistant_delta",
+    "tool.call": "tool_call_start",
+    "tool.result": "tool_call_end",
+    "tool_call": "tool_call_start",
+    "tool_result": "tool_call_end",
+    "approval": "approval_request",
+    "approval_request": "approval_request",
+    "approval_decision": "approval_decision",
+    "steering": "steering_received",
+    "artifact": "artifact_written",
+    "error": "error",
+    "compaction": "compaction",
+    # Pass through if already in Hive format.
+    "session_start": "session_start",
+    "session_end": "session_end",
+    "turn_start": "turn_start",
+    "turn_end": "turn_end",
+    "tool_call_start": "tool_call_start",
+    "tool_call_update": "tool_call_update",
+    "tool_call_end": "tool_call_end",
+    "steering_received": "steering_received",
+    "artifact_written": "artifact_written",
+}
+
+
 def _normalize_hermes_event_kind(hermes_kind: str) -> str:
     """Map Hermes-native event types to Hive trajectory event kinds."""
-    mapping = {
-        # Hermes native → Hive trajectory
-        "session.start": "session_start",
-        "session.end": "session_end",
-        "turn.start": "turn_start",
-        "turn.end": "turn_end",
-        "message": "user_message",
-        "user_message": "user_message",
-        "assistant": "assistant_delta",
-        "assistant_message": "assistant_delta",
-        "assistant_delta": "assistant_delta",
-        "tool.call": "tool_call_start",
-        "tool.result": "tool_call_end",
-        "tool_call": "tool_call_start",
-        "tool_result": "tool_call_end",
-        "approval": "approval_request",
-        "approval_request": "approval_request",
-        "approval_decision": "approval_decision",
-        "steering": "steering_received",
-        "artifact": "artifact_written",
-        "error": "error",
-        "compaction": "compaction",
-        # Pass through if already in Hive format.
-        "session_start": "session_start",
-        "session_end": "session_end",
-        "turn_start": "turn_start",
-        "turn_end": "turn_end",
-        "tool_call_start": "tool_call_start",
-        "tool_call_update": "tool_call_update",
-        "tool_call_end": "tool_call_end",
-        "steering_received": "steering_received",
-        "artifact_written": "artifact_written",
-    }
-    return mapping.get(hermes_kind, hermes_kind or "assistant_delta")
+    return _HERMES_EVENT_KIND_MAP.get(hermes_kind, hermes_kind or "assistant_delta")
 
 
 def _message_text(message: dict[str, Any]) -> str:
@@ -11,7 +11,7 @@ from src.hive.constants import PRIORITY_MAP
 from src.hive.scaffold import generate_program_stub
 from src.hive.store.events import emit_event, event_file
 from src.hive.store.layout import ensure_layout
-from src.hive.store.projects import discover_projects, ensure_project_id
+from src.hive.store.projects import discover_projects, ensure_project_id, write_agency_document
 from src.hive.store.task_files import create_task, get_task, list_tasks, save_task
 from src.hive.workspace import sync_workspace
 from src.security import safe_dump_agency_md
@@ -436,10 +436,7 @@ def _parse_project_tasks(project, root: Path, report: MigrationReport) -> list[I
 
 
 def _persist_project_doc(project, *, content: str) -> None:
-    project.agency_path.write_text(
-        safe_dump_agency_md(project.metadata, content),
-        encoding="utf-8",
-    )
+    write_agency_document(project.agency_path, safe_dump_agency_md(project.metadata, content))
     project.content = content
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from src.hive.store.projects import discover_projects
+from src.hive.store.projects import discover_projects, write_agency_document
 from src.hive.store.task_files import list_tasks
 
 TASK_BEGIN = "<!-- hive:begin task-rollup -->"
@@ -64,6 +64,8 @@ def sync_agency_md(path: str | Path | None = None) -> list[Path]:
         updated = replace_marker_block(
             updated, RUN_BEGIN, RUN_END, _render_recent_runs(project.id, path)
         )
-        project.agency_path.write_text(updated, encoding="utf-8")
+        # Unchanged rollups skip the write so the parse cache and file mtime stay valid.
+        if updated != content:
+            write_agency_document(project.agency_path, updated)
         updated_paths.append(project.agency_path)
     return updated_paths
@@ -8,9 +8,11 @@ from pathlib import Path
 def replace_marker_block(text: str, begin: str, end: str, body: str) -> str:
     """Replace or append a bounded generated section."""
     block = f"{begin}\n{body}\n{end}"
-    if begin in text and end in text:
-        start = text.index(begin)
-        finish = text.index(end, start) + len(end)
+    # One forward find per marker instead of separate membership and index scans.
+    start = text.find(begin)
+    finish = text.find(end, start) if start != -1 else -1
+    if finish != -1:
+        finish += len(end)
         return f"{text[:start].rstrip()}\n\n{block}\n{text[finish:].lstrip()}"
     suffix = "" if text.endswith("\n") else "\n"
     return f"{text}{suffix}\n{block}\n"
@@ -99,19 +99,22 @@ def build_retrieval_artifacts(
         str(hit.get("path") or hit.get("title") or index)
         for index, hit in enumerate(selected)
     }
-    graph_candidates = sum(1 for hit in candidates if str(hit.get("kind") or "") == "project")
-    normalized_candidates = [
-        {
-            "chunk_id": str(hit.get("path") or hit.get("title") or index),
-            "kind": str(hit.get("kind") or "unknown"),
-            "title": str(hit.get("title") or hit.get("path") or "result"),
-            "path": hit.get("path"),
-            "score": float(hit.get("score") or 0.0),
-            "explanation": retrieval_explanation(hit),
-            "provenance": retrieval_provenance(hit) or "workspace_search",
-        }
-        for index, hit in enumerate(candidates)
-    ]
+    graph_candidates = 0
+    normalized_candidates = []
+    for index, hit in enumerate(candidates):
+        kind = str(hit.get("kind") or "")
+        graph_candidates += kind == "project"
+        normalized_candidates.append(
+            {
+                "chunk_id": str(hit.get("path") or hit.get("title") or index),
+                "kind": kind or "unknown",
+                "title": str(hit.get("title") or hit.get("path") or "result"),
+                "path": hit.get("path"),
+                "score": float(hit.get("score") or 0.0),
+                "explanation": retrieval_explanation(hit),
+                "provenance": retrieval_provenance(hit) or "workspace_search",
+            }
+        )
     hits_payload = {
         "query": query,
         "intent": intent,
@@ -57,9 +57,11 @@ def _read_approvals(metadata: dict[str, Any]) -> list[dict[str, Any]]:
 def _write_approvals(metadata: dict[str, Any], approvals: list[dict[str, Any]]) -> None:
     target = _approval_file(metadata)
     target.parent.mkdir(parents=True, exist_ok=True)
-    with open(target, "w", encoding="utf-8") as handle:
-        for item in approvals:
-            handle.write(json.dumps(item, sort_keys=True) + "\n")
+    # Serialize up front so the rewrite is one write call rather than one per record.
+    target.write_text(
+        "".join(json.dumps(item, sort_keys=True) + "\n" for item in approvals),
+        encoding="utf-8",
+    )
 
 
 def list_approvals(path: str | Path | None, run_id: str) -> list[dict[str, Any]]:
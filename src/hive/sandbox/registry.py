@@ -13,6 +13,9 @@ from typing import Iterable
 
 from src.hive.sandbox.base import SandboxProbe
 
+# `--version` output keyed by (binary path, st_mtime_ns); only successful probes are kept.
+_VERSION_OUTPUTS: dict[tuple[str, int], str] = {}
+
 
 class SandboxBackend(ABC):
     """Probe-only backend skeleton until full runtime integration lands."""
@@ -44,6 +47,22 @@ class BinarySandboxBackend(SandboxBackend):
         binary = self._find_binary()
         if binary is None:
             return None
+        if args != ("--version",):
+            return self._run_binary(binary, *args)
+        # A binary's version only changes with the file, so repeat probes skip the fork.
+        try:
+            key = (binary, os.stat(binary).st_mtime_ns)
+        except OSError:
+            return None
+        version = _VERSION_OUTPUTS.get(key)
+        if version is None:
+            version = self._run_binary(binary, *args)
+            if version is not None:
+                _VERSION_OUTPUTS[key] = version
+        return version
+
+    @staticmethod
+    def _run_binary(binary: str, *args: str) -> str | None:
         try:
             completed = subprocess.run(
                 [binary, *args],
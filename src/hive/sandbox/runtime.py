@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import atexit
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -30,6 +31,19 @@ _ASRT_SETTINGS_FILE_NAME = "settings.json"
 _ASRT_SETTINGS_MAX_AGE_SECONDS = 24 * 60 * 60
 _ASRT_SETTINGS_CLEANUP_DIRS: set[Path] = set()
 _RESOLVED_BACKEND_BINARIES: dict[str, str] = {}
+# Flags that never vary per command; sandboxed_command() splices them around the mounts.
+_CONTAINER_RUN_ARGS = (
+    "run",
+    "--rm",
+    "--interactive",
+    "--read-only",
+    "--tmpfs",
+    "/tmp:rw,noexec,nosuid,size=64m",
+    "--network",
+    "none",
+)
+_CONTAINER_HARDENING_ARGS = ("--cap-drop", "ALL", "--security-opt", "no-new-privileges")
+_PODMAN_EXTRA_ARGS = ("--userns=keep-id", "--security-opt", "label=disable")
 
 
 def _backend_readiness_reason(backend_name: str, probe) -> str:
@@ -61,10 +75,21 @@ def _sandbox_profile_unavailable(
     )
 
 
+def _resolve_host_path(value: str) -> Path:
+    """Resolve a host mount path, keyed on its absolute form so cwd changes cannot go stale."""
+    return _resolve_absolute_host_path(os.path.abspath(value))
+
+
+@lru_cache(maxsize=64)
+def _resolve_absolute_host_path(value: str) -> Path:
+    """Resolve an absolute host path once; a run reuses the same few roots for every command."""
+    return Path(value).resolve()
+
+
 def _read_write_mounts(policy: SandboxPolicy, cwd: Path) -> tuple[Path, Path]:
-    mounts = list(policy.mounts.get("read_write") or [])
-    host_worktree = Path(str(mounts[0] if mounts else cwd)).resolve()
-    host_artifacts = Path(str(mounts[1] if len(mounts) > 1 else cwd)).resolve()
+    mounts = policy.mounts.get("read_write") or ()
+    host_worktree = _resolve_host_path(str(mounts[0] if mounts else cwd))
+    host_artifacts = _resolve_host_path(str(mounts[1] if len(mounts) > 1 else cwd))
     return host_worktree, host_artifacts
 
 
@@ -279,49 +304,37 @@ def sandboxed_command(
             f"Sandbox backend {policy.backend!r} is not wired into the local executor yet."
         )
 
-    binary = "podman" if policy.backend == "podman" else "docker"
+    # The probe-resolved absolute path spares exec a PATH search on every command.
+    binary = _resolved_backend_binary(policy.backend)
     image = os.environ.get("HIVE_SANDBOX_IMAGE", "python:3.11-slim")
     host_worktree, host_artifacts = _read_write_mounts(policy, cwd)
     container_worktree = str(policy.mounts.get("container_worktree") or "/workspace")
     container_artifacts = str(policy.mounts.get("container_artifacts") or "/artifacts")
     try:
-        relative_cwd = cwd.resolve().relative_to(host_worktree)
+        relative_cwd = _resolve_host_path(str(cwd)).relative_to(host_worktree)
     except ValueError:
         relative_cwd = Path(".")
     container_cwd = str((Path(container_worktree) / relative_cwd).as_posix())
     base = [
         binary,
-        "run",
-        "--rm",
-        "--interactive",
-        "--read-only",
-        "--tmpfs",
-        "/tmp:rw,noexec,nosuid,size=64m",
-        "--network",
-        "none",
+        *_CONTAINER_RUN_ARGS,
         "--volume",
         f"{host_worktree}:{container_worktree}:rw",
         "--volume",
         f"{host_artifacts}:{container_artifacts}:rw",
         "--workdir",
         container_cwd,
-        "--cap-drop",
-        "ALL",
-        "--security-opt",
-        "no-new-privileges",
+        *_CONTAINER_HARDENING_ARGS,
     ]
-    for readonly in list(policy.mounts.get("read_only") or []):
-        readonly_path = Path(str(readonly)).resolve()
+    for readonly in policy.mounts.get("read_only") or ():
+        readonly_path = _resolve_host_path(str(readonly))
         target_name = readonly_path.name or "ro"
-        base.extend(["--volume", f"{readonly_path}:/readonly/{target_name}:ro"])
-    for env_name in list(policy.env.get("allowlist") or []):
-        value = os.environ.get(str(env_name))
-        if value is not None:
-            base.extend(["--env", f"{env_name}={value}"])
-    for env_name in list(policy.env.get("passthrough") or []):
-        value = os.environ.get(str(env_name))
-        if value is not None:
-            base.extend(["--env", f"{env_name}={value}"])
+        base.extend(("--volume", f"{readonly_path}:/readonly/{target_name}:ro"))
+    for env_names in (policy.env.get("allowlist"), policy.env.get("passthrough")):
+        for env_name in env_names or ():
+            value = os.environ.get(str(env_name))
+            if value is not None:
+                base.extend(("--env", f"{env_name}={value}"))
     cpu_limit = policy.resources.get("cpu")
     memory_mb = policy.resources.get("memory_mb")
     if cpu_limit:
@@ -329,8 +342,8 @@ def sandboxed_command(
     if memory_mb:
         base.extend(["--memory", f"{memory_mb}m"])
     if policy.backend == "podman":
-        base.extend(["--userns=keep-id", "--security-opt", "label=disable"])
-    base.extend([image, "sh", "-lc", command])
+        base.extend(_PODMAN_EXTRA_ARGS)
+    base.extend((image, "sh", "-lc", command))
     return base, False
 
 
@@ -211,24 +211,27 @@ def _find_project_cycles(graph: dict[str, set[str]]) -> list[list[str]]:
     """Detect dependency cycles in the project graph."""
     cycles: set[tuple[str, ...]] = set()
 
-    def _visit(node: str, path: list[str], visiting: set[str]) -> None:
-        visiting.add(node)
-        path.append(node)
-        for neighbor in sorted(graph.get(node, set())):
+    # Walk with an explicit stack of neighbor iterators so long dependency chains
+    # cannot hit Python's recursion limit.
+    for root in sorted(graph):
+        path = [root]
+        visiting = {root}
+        pending = [iter(sorted(graph.get(root, set())))]
+        while pending:
+            neighbor = next(pending[-1], None)
+            if neighbor is None:
+                pending.pop()
+                visiting.discard(path.pop())
+                continue
             if neighbor not in graph:
                 continue
             if neighbor in visiting:
                 start = path.index(neighbor)
                 cycles.add(_normalize_cycle(path[start:] + [neighbor]))
                 continue
-            if neighbor in path:
-                continue
-            _visit(neighbor, path, visiting)
-        path.pop()
-        visiting.discard(node)
-
-    for node in sorted(graph):
-        _visit(node, [], set())
+            path.append(neighbor)
+            visiting.add(neighbor)
+            pending.append(iter(sorted(graph.get(neighbor, set()))))
     return [list(cycle) for cycle in sorted(cycles)]
 
 
@@ -334,7 +334,15 @@ def _packaged_docs_root():
 
 
 def _read_doc_resource(relative_path: str) -> tuple[str, str] | None:
-    source_path = _repo_root() / relative_path
+    return _read_doc_resource_cached(_repo_root(), relative_path)
+
+
+# Docs and examples are static for the life of a process, so repeated MCP/CLI
+# searches reuse their text instead of rereading every file. Keying on the repo
+# root keeps `_repo_root()` overrides (packaged-docs fallback) honest.
+@lru_cache(maxsize=128)
+def _read_doc_resource_cached(repo_root: Path, relative_path: str) -> tuple[str, str] | None:
+    source_path = repo_root / relative_path
     if source_path.exists():
         return str(source_path), source_path.read_text(encoding="utf-8")
 
@@ -349,7 +357,16 @@ def _read_doc_resource(relative_path: str) -> tuple[str, str] | None:
 
 
 def _iter_text_resources(relative_dir: str):
-    source_root = _repo_root() / relative_dir
+    return _text_resources(_repo_root(), relative_dir)
+
+
+@lru_cache(maxsize=16)
+def _text_resources(repo_root: Path, relative_dir: str) -> tuple[tuple[str, str, str], ...]:
+    return tuple(_walk_text_resources(repo_root, relative_dir))
+
+
+def _walk_text_resources(repo_root: Path, relative_dir: str):
+    source_root = repo_root / relative_dir
     if source_root.exists():
         for file_path in sorted(source_root.rglob("*")):
             if (
@@ -44,6 +44,8 @@ def _cache_lock(lock_path: Path, *, timeout_seconds: float = 15.0):
             yield
             return
         deadline = time.monotonic() + timeout_seconds
+        # Locks are usually held briefly, so retry fast at first and back off to 50ms.
+        delay = 0.001
         while True:
             try:
                 fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
@@ -54,7 +56,8 @@ def _cache_lock(lock_path: Path, *, timeout_seconds: float = 15.0):
                         "Hive is already rebuilding the cache for this workspace. "
                         "Wait a moment, then retry the command."
                     ) from exc
-                time.sleep(0.05)
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
         try:
             yield
         finally:
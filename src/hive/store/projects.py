@@ -5,11 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 import re
 
+from src.hive.common import StatCachedParser
 from src.hive.constants import PRIORITY_MAP
 from src.hive.ids import new_id
 from src.hive.models.project import ProjectRecord
 from src.hive.scaffold import generate_program_stub
-from src.security import safe_dump_agency_md, safe_load_agency_md
+from src.security import ParsedAgencyMd, safe_dump_agency_md, safe_load_agency_md
 
 
 SLUG_PART_RE = re.compile(r"[^a-z0-9]+")
@@ -113,35 +114,74 @@ Use this document for human context, links, architecture notes, and handoff deta
 """
 
 
+def _parse_agency(agency_path: Path) -> ParsedAgencyMd:
+    return safe_load_agency_md(agency_path)
+
+
+_AGENCY_PARSER: StatCachedParser[ParsedAgencyMd] = StatCachedParser(_parse_agency, maxsize=512)
+
+
+def _load_agency(agency_path: Path) -> ParsedAgencyMd:
+    """Load AGENCY.md, reusing the last parse while the file is unchanged on disk."""
+    return _AGENCY_PARSER.load(agency_path)
+
+
+def write_agency_document(agency_path: Path, text: str) -> None:
+    """Atomically write AGENCY.md text and drop cached parses that may now be stale."""
+    _AGENCY_PARSER.write(agency_path, text)
+
+
+def _project_from_agency(projects_root: Path, agency_path: Path) -> ProjectRecord:
+    parsed = _load_agency(agency_path)
+    rel_slug = agency_path.parent.relative_to(projects_root).as_posix()
+    project_id = parsed.metadata.get("project_id") or new_id("proj")
+    title = _extract_title(parsed.content, agency_path.parent.name)
+    return ProjectRecord(
+        id=project_id,
+        slug=rel_slug,
+        agency_path=agency_path,
+        title=title,
+        status=parsed.metadata.get("status", "active"),
+        priority=_priority_value(parsed.metadata.get("priority", "medium")),
+        owner=parsed.metadata.get("owner"),
+        metadata=parsed.metadata,
+        content=parsed.content,
+    )
+
+
 def discover_projects(path: str | Path | None = None) -> list[ProjectRecord]:
     """Discover projects from AGENCY.md files."""
     base = Path(path or Path.cwd())
     projects_root = base / "projects"
-    if not projects_root.exists():
-        return []
-
     projects: list[ProjectRecord] = []
+    # A missing projects/ directory just globs to nothing; no exists() probe first.
     for agency_path in sorted(projects_root.glob("**/AGENCY.md")):
-        parsed = safe_load_agency_md(agency_path)
-        rel_slug = agency_path.parent.relative_to(projects_root).as_posix()
-        project_id = parsed.metadata.get("project_id") or new_id("proj")
-        title = _extract_title(parsed.content, agency_path.parent.name)
-        projects.append(
-            ProjectRecord(
-                id=project_id,
-                slug=rel_slug,
-                agency_path=agency_path,
-                title=title,
-                status=parsed.metadata.get("status", "active"),
-                priority=_priority_value(parsed.metadata.get("priority", "medium")),
-                owner=parsed.metadata.get("owner"),
-                metadata=parsed.metadata,
-                content=parsed.content,
-            )
-        )
+        projects.append(_project_from_agency(projects_root, agency_path))
     return projects
 
 
+def _direct_agency_path(
+    projects_root: Path, reference: str, candidate_path: Path
+) -> Path | None:
+    """Return the AGENCY.md a slug or path reference names, without scanning."""
+    if not reference:
+        return None
+    resolved_root = projects_root.resolve()
+    for candidate in (
+        candidate_path,
+        candidate_path / "AGENCY.md",
+        projects_root / reference / "AGENCY.md",
+    ):
+        if candidate.name != "AGENCY.md" or not candidate.is_file():
+            continue
+        try:
+            rel_dir = candidate.resolve().parent.relative_to(resolved_root)
+        except ValueError:
+            continue
+        return projects_root / rel_dir / "AGENCY.md"
+    return None
+
+
 def get_project(path: str | Path | None, project_id: str) -> ProjectRecord:
     """Get a single project by ID, slug, or path."""
     root = Path(path or Path.cwd()).resolve()
@@ -150,6 +190,12 @@ def get_project(path: str | Path | None, project_id: str) -> ProjectRecord:
     if not candidate_path.is_absolute():
         candidate_path = (root / candidate_path).resolve()
 
+    # Slug and path references name one file; only id lookups need the full scan.
+    projects_root = root / "projects"
+    agency_path = _direct_agency_path(projects_root, reference, candidate_path)
+    if agency_path is not None:
+        return _project_from_agency(projects_root, agency_path)
+
     for project in discover_projects(root):
         agency_path = project.agency_path.resolve()
         if reference in {project.id, project.slug}:
@@ -199,9 +245,9 @@ def create_project(
     if tags:
         metadata["tags"] = list(tags)
 
-    agency_path.write_text(
+    write_agency_document(
+        agency_path,
         safe_dump_agency_md(metadata, _default_agency_body(resolved_title, objective)),
-        encoding="utf-8",
     )
 
     generate_program_stub(project_dir)
@@ -214,17 +260,17 @@ def ensure_project_id(project: ProjectRecord) -> ProjectRecord:
         return project
 
     project.metadata["project_id"] = project.id
-    project.agency_path.write_text(
+    write_agency_document(
+        project.agency_path,
         safe_dump_agency_md(project.metadata, project.content),
-        encoding="utf-8",
     )
     return project
 
 
 def save_project(project: ProjectRecord) -> ProjectRecord:
     """Persist project metadata and content back to AGENCY.md."""
-    project.agency_path.write_text(
+    write_agency_document(
+        project.agency_path,
         safe_dump_agency_md(project.metadata, project.content),
-        encoding="utf-8",
     )
     return project
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from src.hive.clock import utc_now_iso
+from src.hive.common import StatCachedParser
 from src.hive.ids import new_id
 from src.hive.models.task import TaskRecord
 from src.hive.store.layout import tasks_dir
@@ -21,7 +22,9 @@ def _parse_sections(body: str) -> tuple[dict[str, str], list[tuple[str, str]]]:
     section_order: list[str] = ["Summary"]
     current = "Summary"
     for line in body.splitlines():
-        match = _SECTION_RE.match(line.strip())
+        stripped = line.strip()
+        # Only "##" lines can be headers; skip the regex for ordinary body text.
+        match = _SECTION_RE.match(stripped) if stripped.startswith("##") else None
         if match:
             name = match.group(1).strip()
             current = name
@@ -62,7 +65,12 @@ def task_path(path: str | Path | None, task_id: str) -> Path:
 
 
 def load_task(file_path: str | Path) -> TaskRecord:
-    """Load a canonical task file."""
+    """Load a canonical task file, reusing the last parse while it is unchanged on disk."""
+    return _TASK_PARSER.load(file_path)
+
+
+def _parse_task(file_path: Path) -> TaskRecord:
+    """Parse one canonical task file from disk."""
     parsed = safe_load_agency_md(Path(file_path))
     metadata = dict(parsed.metadata)
     sections, extra_sections = _parse_sections(parsed.content)
@@ -116,15 +124,17 @@ def load_task(file_path: str | Path) -> TaskRecord:
     return task
 
 
+_TASK_PARSER: StatCachedParser[TaskRecord] = StatCachedParser(_parse_task, maxsize=4096)
+
+
 def save_task(path: str | Path | None, task: TaskRecord) -> Path:
     """Persist a canonical task file."""
     task.validate()
     task.updated_at = utc_now_iso()
     target = task.path or task_path(path, task.id)
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(
-        safe_dump_agency_md(task.to_frontmatter(), _serialize_sections(task)),
-        encoding="utf-8",
+    _TASK_PARSER.write(
+        target, safe_dump_agency_md(task.to_frontmatter(), _serialize_sections(task))
     )
     task.path = target
     return target
@@ -141,9 +151,8 @@ def save_task_file(task: TaskRecord, file_path: str | Path) -> Path:
     task.updated_at = utc_now_iso()
     target = Path(file_path)
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(
-        safe_dump_agency_md(task.to_frontmatter(), _serialize_sections(task)),
-        encoding="utf-8",
+    _TASK_PARSER.write(
+        target, safe_dump_agency_md(task.to_frontmatter(), _serialize_sections(task))
     )
     task.path = target
     return target
@@ -220,14 +229,25 @@ def update_task(path: str | Path | None, task_id: str, patch: dict[str, Any]) ->
 
 
 def claim_task(
-    path: str | Path | None, task_id: str, owner: str, ttl_minutes: int = 30
+    path: str | Path | None,
+    task_id: str,
+    owner: str,
+    ttl_minutes: int = 30,
+    *,
+    task: TaskRecord | None = None,
 ) -> TaskRecord:
-    """Claim a task lease."""
+    """Claim a task lease.
+
+    Callers that already loaded the task can pass it as ``task`` to skip re-reading its file.
+    """
     from datetime import timedelta
 
     from src.hive.clock import utc_now
 
-    task = get_task(path, task_id)
+    if task is None:
+        task = get_task(path, task_id)
+    elif task.id != task_id:
+        raise ValueError(f"Loaded task {task.id} does not match {task_id}")
     expires_at = utc_now() + timedelta(minutes=ttl_minutes)
     task.owner = owner
     task.claimed_until = expires_at.isoformat().replace("+00:00", "Z")
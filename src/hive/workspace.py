@@ -31,6 +31,8 @@ def _workspace_lock(lock_path: Path, *, timeout_seconds: float = 15.0):
             yield
             return
         deadline = time.monotonic() + timeout_seconds
+        # Mirror the cache lock: start at 1ms and double up to the former 50ms poll.
+        delay = 0.001
         while True:
             try:
                 fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
@@ -41,7 +43,8 @@ def _workspace_lock(lock_path: Path, *, timeout_seconds: float = 15.0):
                         "Hive is already refreshing this workspace. "
                         "Wait a moment, then retry the command."
                     ) from exc
-                time.sleep(0.05)
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
         try:
             yield
         finally:
@@ -29,127 +29,133 @@ def format_response(success: bool, data: Any = None, error: str | None = None) -
 app = Server("hive-mcp")
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List the thin v2 MCP tool surface."""
-    return [
-        Tool(
-            name="search",
-            description=(
-                "Search workspace state, API docs, schemas, examples, and project summaries"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "The search query"},
-                    "scopes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "Optional search scopes such as api, examples, project, workspace"
-                        ),
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 8,
-                    },
+# The tool surface is static, so build the schemas once instead of per handshake.
+TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="search",
+        description="Search workspace state, API docs, schemas, examples, and project summaries",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "The search query"},
+                "scopes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Optional search scopes such as api, examples, project, workspace"
+                    ),
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 8,
                 },
-                "required": ["query"],
             },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="execute",
+        description=(
+            "Execute bounded local Python against a typed Hive client. "
+            "This is not a full sandbox."
         ),
-        Tool(
-            name="execute",
-            description=(
-                "Execute bounded local Python against a typed Hive client. "
-                "This is not a full sandbox."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "language": {
-                        "type": "string",
-                        "description": (
-                            "Execution language. Bounded local execute currently supports python."
-                        ),
-                        "default": "python",
-                    },
-                    "profile": {
-                        "type": "string",
-                        "description": "Execution profile label",
-                        "default": "default",
-                    },
-                    "code": {
-                        "type": "string",
-                        "description": (
-                            "Python source code that defines `result = ...` or `main(hive)`"
-                        ),
-                    },
-                    "timeout_seconds": {
-                        "type": "integer",
-                        "description": "Maximum wall clock time for the subprocess",
-                        "default": 20,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "language": {
+                    "type": "string",
+                    "description": (
+                        "Execution language. Bounded local execute currently supports python."
+                    ),
+                    "default": "python",
+                },
+                "profile": {
+                    "type": "string",
+                    "description": "Execution profile label",
+                    "default": "default",
+                },
+                "code": {
+                    "type": "string",
+                    "description": (
+                        "Python source code that defines `result = ...` or `main(hive)`"
+                    ),
+                },
+                "timeout_seconds": {
+                    "type": "integer",
+                    "description": "Maximum wall clock time for the subprocess",
+                    "default": 20,
                 },
-                "required": ["code"],
             },
-        ),
-    ]
+            "required": ["code"],
+        },
+    ),
+)
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List the thin v2 MCP tool surface."""
+    return list(TOOLS)
+
+
+def _handle_search(arguments: dict, base_path: str) -> dict[str, Any]:
+    query = arguments.get("query")
+    if not query:
+        return format_response(success=False, error="query is required")
+    results = search_workspace(
+        base_path,
+        query,
+        scopes=arguments.get("scopes"),
+        limit=int(arguments.get("limit", 8)),
+    )
+    return format_response(
+        success=True,
+        data={"count": len(results), "results": results},
+    )
+
+
+def _handle_execute(arguments: dict, base_path: str) -> dict[str, Any]:
+    code = arguments.get("code")
+    if not code:
+        return format_response(success=False, error="code is required")
+    payload = execute_code(
+        base_path,
+        language=str(arguments.get("language", "python")),
+        code=code,
+        profile=str(arguments.get("profile", "default")),
+        timeout_seconds=int(arguments.get("timeout_seconds", 20)),
+    )
+    return format_response(
+        success=bool(payload.get("ok")),
+        data={
+            "value": payload.get("value"),
+            "stdout": payload.get("stdout", ""),
+            "stderr": payload.get("stderr", ""),
+            "language": payload.get("language"),
+            "profile": payload.get("profile"),
+            "timed_out": payload.get("timed_out", False),
+        },
+        error=payload.get("error"),
+    )
+
+
+# Tool name -> handler, kept alongside TOOLS so dispatch is a single dict lookup.
+_HANDLERS = {
+    "search": _handle_search,
+    "execute": _handle_execute,
+}
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle the thin v2 MCP tool calls."""
-    base_path = get_base_path()
-
+    handler = _HANDLERS.get(name)
     try:
-        if name == "search":
-            query = arguments.get("query")
-            if not query:
-                result = format_response(success=False, error="query is required")
-            else:
-                results = search_workspace(
-                    base_path,
-                    query,
-                    scopes=arguments.get("scopes"),
-                    limit=int(arguments.get("limit", 8)),
-                )
-                result = format_response(
-                    success=True,
-                    data={"count": len(results), "results": results},
-                )
-
-        elif name == "execute":
-            code = arguments.get("code")
-            if not code:
-                result = format_response(success=False, error="code is required")
-            else:
-                payload = execute_code(
-                    base_path,
-                    language=str(arguments.get("language", "python")),
-                    code=code,
-                    profile=str(arguments.get("profile", "default")),
-                    timeout_seconds=int(arguments.get("timeout_seconds", 20)),
-                )
-                result = format_response(
-                    success=bool(payload.get("ok")),
-                    data={
-                        "value": payload.get("value"),
-                        "stdout": payload.get("stdout", ""),
-                        "stderr": payload.get("stderr", ""),
-                        "language": payload.get("language"),
-                        "profile": payload.get("profile"),
-                        "timed_out": payload.get("timed_out", False),
-                    },
-                    error=payload.get("error"),
-                )
-
+        if handler is None:
+            result = format_response(success=False, error=f"Unknown tool: {name}")
         else:
-            result = format_response(
-                success=False,
-                error=f"Unknown tool: {name}",
-            )
-
+            result = handler(arguments, get_base_path())
     except Exception as e:  # pylint: disable=broad-except
         result = format_response(success=False, error=str(e))
 
@@ -33,25 +33,63 @@ MAX_ISSUE_BODY_LENGTH = 4000
 # Maximum length for agent notes (injection prevention)
 MAX_AGENT_NOTE_LENGTH = 2000
 
-# Patterns to strip from untrusted content (injection prevention)
+# Patterns to strip from untrusted content (injection prevention).
+# Groups are non-capturing since only whole matches are replaced.
 INJECTION_PATTERNS = [
     # Prompt injection patterns
-    r"(?i)ignore\s+(all\s+)?(previous\s+)?instructions?",
-    r"(?i)disregard\s+(all\s+)?(previous\s+)?instructions?",
-    r"(?i)forget\s+(all\s+)?(previous\s+)?instructions?",
-    r"(?i)override\s+(all\s+)?(previous\s+)?instructions?",
+    r"(?i)ignore\s+(?:all\s+)?(?:previous\s+)?instructions?",
+    r"(?i)disregard\s+(?:all\s+)?(?:previous\s+)?instructions?",
+    r"(?i)forget\s+(?:all\s+)?(?:previous\s+)?instructions?",
+    r"(?i)override\s+(?:all\s+)?(?:previous\s+)?instructions?",
     r"(?i)system\s*:\s*",
     r"(?i)assistant\s*:\s*",
     r"(?i)user\s*:\s*",
     # Command injection patterns
-    r"(?i)(exec|eval|system|shell)\s*[:(]",
-    # Exfiltration patterns
-    r"(?i)(exfil|leak|steal|extract)\s+.*(key|secret|token|password)",
+    r"(?i)(?:exec|eval|system|shell)\s*[:(]",
+    # Exfiltration patterns. The possessive \s++ never gives whitespace back to .*, which
+    # could match it anyway; without it a long whitespace run backtracks quadratically.
+    r"(?i)(?:exfil|leak|steal|extract)\s++.*(?:key|secret|token|password)",
 ]
 
 # Compiled injection patterns for performance
 COMPILED_INJECTION_PATTERNS = [re.compile(p) for p in INJECTION_PATTERNS]
 
+# Every injection pattern needs one of these words (matched case-insensitively)
+_INJECTION_KEYWORDS = (
+    "ignore",
+    "disregard",
+    "forget",
+    "override",
+    "system",
+    "assistant",
+    "user",
+    "exec",
+    "eval",
+    "shell",
+    "exfil",
+    "leak",
+    "steal",
+    "extract",
+)
+
+# Script-capable HTML blocks removed from untrusted text, applied in this order
+_DANGEROUS_TAG_PATTERNS = tuple(
+    re.compile(rf"<{tag}[\s\S]*?</{tag}>", re.IGNORECASE) for tag in ("script", "iframe", "object")
+)
+
+# Fenced and inline code spans in untrusted content
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+
+# Issue-body mentions that may stay live; any other @username is defused
+_ALLOWED_MENTIONS = frozenset(("claude", "claude-code"))
+_MENTION_NAME_RE = re.compile(r"[-a-zA-Z0-9_]+")
+
+# Prefer the libyaml-backed safe loader when PyYAML was built with it; it is
+# restricted to the same safe tag set as the pure-Python SafeLoader. Dumping
+# stays pure Python because CSafeDumper escapes non-BMP characters such as emoji.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class ParsedAgencyMd:
@@ -76,7 +114,7 @@ class PromptInjectionError(SecurityError):
 
 def safe_load_yaml(yaml_string: str) -> Dict[str, Any]:
     """
-    Safely load YAML content using yaml.safe_load.
+    Safely load YAML content using the safe (optionally libyaml) loader.
 
     This prevents arbitrary code execution from malicious YAML payloads
     such as !!python/object, !!python/object/apply, etc.
@@ -91,7 +129,7 @@ def safe_load_yaml(yaml_string: str) -> Dict[str, Any]:
         YAMLSecurityError: If YAML parsing fails or content is invalid
     """
     try:
-        result = yaml.safe_load(yaml_string)
+        result = yaml.load(yaml_string, Loader=_YAML_SAFE_LOADER)
         if result is None:
             return {}
         if not isinstance(result, dict):
@@ -113,7 +151,7 @@ def safe_load_agency_md(file_path: Path) -> ParsedAgencyMd:
     The function:
     1. Reads the file content
     2. Splits on --- delimiters to extract frontmatter
-    3. Uses yaml.safe_load() to parse the YAML (prevents RCE)
+    3. Uses the safe YAML loader (libyaml when available) to parse it (prevents RCE)
     4. Returns a ParsedAgencyMd with metadata, content, and raw text
 
     Args:
@@ -159,22 +197,20 @@ def safe_parse_frontmatter(content: str) -> ParsedAgencyMd:
         # No frontmatter, return empty metadata
         return ParsedAgencyMd(metadata={}, content=content, raw=content)
 
-    # Split on --- delimiters
+    # Locate the closing --- delimiter
     # Format should be: ---\nYAML\n---\nContent
-    parts = content.split("---", 2)
+    closing = content.find("---", 3)
 
-    if len(parts) < 3:
+    if closing < 0:
         # Invalid format - only one delimiter or malformed
         raise ValueError(
             "Invalid frontmatter format: expected '---' delimiters "
             "at start and after YAML block"
         )
 
-    # parts[0] is empty (before first ---)
-    # parts[1] is the YAML frontmatter
-    # parts[2] is the content after the second ---
-    frontmatter_str = parts[1].strip()
-    body_content = parts[2].strip()
+    # Slice around the delimiters directly rather than splitting into a list
+    frontmatter_str = content[3:closing].strip()
+    body_content = content[closing + 3 :].strip()
 
     # Parse YAML safely
     metadata = safe_load_yaml(frontmatter_str)
@@ -198,6 +234,26 @@ def safe_dump_agency_md(metadata: Dict[str, Any], content: str) -> str:
     return f"---\n{yaml_str}---\n\n{content}"
 
 
+def _may_contain_injection(text: str) -> bool:
+    """Cheap exact pre-check: False only if no injection pattern can match ``text``."""
+    # re's IGNORECASE also folds a few non-ASCII letters onto ASCII ones (e.g. "ı" and
+    # "İ" onto "i"), so a plain lower-cased substring test is only exact for ASCII text.
+    if not text.isascii():
+        return True
+    lowered = text.lower()
+    return any(keyword in lowered for keyword in _INJECTION_KEYWORDS)
+
+
+def _strip_dangerous_tags(text: str) -> str:
+    """Remove <script>, <iframe> and <object> blocks, one tag type at a time."""
+    # Every pattern needs an opening "<", so plain text skips all three scans.
+    if "<" not in text:
+        return text
+    for pattern in _DANGEROUS_TAG_PATTERNS:
+        text = pattern.sub("", text)
+    return text
+
+
 def sanitize_untrusted_content(content: str, max_length: int = 10000) -> str:
     """
     Sanitize untrusted content to prevent prompt injection.
@@ -221,28 +277,33 @@ def sanitize_untrusted_content(content: str, max_length: int = 10000) -> str:
     # Truncate to max length
     sanitized = content[:max_length]
 
-    # Remove code blocks that might contain hidden instructions
-    sanitized = re.sub(r"```[\s\S]*?```", "[CODE BLOCK REMOVED]", sanitized)
+    # Remove code blocks that might contain hidden instructions. Both code
+    # patterns need a literal backtick, so plain prose skips the regex engine.
+    has_backtick = "`" in sanitized
+    if has_backtick and "```" in sanitized:
+        sanitized = _CODE_BLOCK_RE.sub("[CODE BLOCK REMOVED]", sanitized)
 
     # Remove inline code that might contain injections
     # (only if it looks like it contains suspicious content)
     def replace_suspicious_code(match):
         code_content = match.group(1)
+        if not _may_contain_injection(code_content):
+            return match.group(0)
         for pattern in COMPILED_INJECTION_PATTERNS:
             if pattern.search(code_content):
                 return "[CODE REMOVED]"
         return match.group(0)
 
-    sanitized = re.sub(r"`([^`]+)`", replace_suspicious_code, sanitized)
+    if has_backtick:
+        sanitized = _INLINE_CODE_RE.sub(replace_suspicious_code, sanitized)
 
-    # Strip injection patterns
-    for pattern in COMPILED_INJECTION_PATTERNS:
-        sanitized = pattern.sub("[FILTERED]", sanitized)
+    # Strip injection patterns (most content contains no trigger word at all)
+    if _may_contain_injection(sanitized):
+        for pattern in COMPILED_INJECTION_PATTERNS:
+            sanitized = pattern.sub("[FILTERED]", sanitized)
 
     # Remove HTML/script tags that might bypass markdown rendering
-    sanitized = re.sub(r"<script[\s\S]*?</script>", "", sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r"<iframe[\s\S]*?</iframe>", "", sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r"<object[\s\S]*?</object>", "", sanitized, flags=re.IGNORECASE)
+    sanitized = _strip_dangerous_tags(sanitized)
 
     return sanitized.strip()
 
@@ -330,21 +391,31 @@ def sanitize_issue_body(body: str) -> str:
     sanitized = body[:MAX_ISSUE_BODY_LENGTH]
 
     # Remove HTML/script tags that might bypass markdown rendering
-    sanitized = re.sub(r"<script[\s\S]*?</script>", "", sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r"<iframe[\s\S]*?</iframe>", "", sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r"<object[\s\S]*?</object>", "", sanitized, flags=re.IGNORECASE)
+    sanitized = _strip_dangerous_tags(sanitized)
 
     # Filter @mentions - only allow @claude and @claude-code
     # Other mentions could trigger unwanted notifications
-    # The negative lookahead checks that we DON'T have exactly 'claude' or 'claude-code'
-    # by ensuring there are no more username characters after these strings
-    sanitized = re.sub(
-        r"@(?!claude(?![-a-zA-Z0-9_])|claude-code(?![-a-zA-Z0-9_]))([a-zA-Z0-9_-]+)",
-        r"[at]\1",
-        sanitized,
-    )
-
-    return sanitized
+    return _filter_mentions(sanitized)
+
+
+def _filter_mentions(text: str) -> str:
+    """Rewrite every @username except the allowed ones to [at]username."""
+    parts: list[str] = []
+    start = 0
+    # Jump between "@" signs with str.find; bodies without mentions cost one scan.
+    pos = text.find("@")
+    while pos != -1:
+        # The whole username must match, so @claude-bot is still filtered
+        match = _MENTION_NAME_RE.match(text, pos + 1)
+        if match and match.group() not in _ALLOWED_MENTIONS:
+            parts.append(text[start:pos])
+            parts.append("[at]")
+            start = pos + 1
+        pos = text.find("@", pos + 1)
+    if not parts:
+        return text
+    parts.append(text[start:])
+    return "".join(parts)
 
 
 def validate_path_within_base(file_path: Path, base_path: Path) -> bool:
@@ -363,11 +434,12 @@ def validate_path_within_base(file_path: Path, base_path: Path) -> bool:
         True if the path is safe, False otherwise
     """
     try:
-        resolved_file = file_path.resolve()
-        resolved_base = base_path.resolve()
-        # Use is_relative_to() to properly check containment
-        # This prevents prefix attacks like /hive_evil matching /hive
-        return resolved_file.is_relative_to(resolved_base)
+        # Resolve with os.path.realpath on plain strings; Path.resolve() does the
+        # same syscalls plus a Path allocation per call.
+        resolved_file = os.path.realpath(file_path)
+        resolved_base = os.path.realpath(base_path)
+        # Compare whole path components so /hive_evil does not match /hive
+        return os.path.commonpath([resolved_file, resolved_base]) == resolved_base
     except (OSError, ValueError):
         return False
 
@@ -388,8 +460,12 @@ def validate_api_key(provided_key: Optional[str], expected_key: Optional[str]) -
     if not provided_key or not expected_key:
         return False
 
-    # Use constant-time comparison to prevent timing attacks
-    return hmac.compare_digest(provided_key.encode(), expected_key.encode())
+    # Use constant-time comparison to prevent timing attacks. ASCII keys compare
+    # as str directly; compare_digest rejects non-ASCII str, so encode those.
+    try:
+        return hmac.compare_digest(provided_key, expected_key)
+    except TypeError:
+        return hmac.compare_digest(provided_key.encode(), expected_key.encode())
 
 
 def get_api_key_from_env(key_name: str = "HIVE_API_KEY") -> Optional[str]:
@@ -422,7 +498,9 @@ def mask_secret(secret: str, visible_chars: int = 4) -> str:
     if len(secret) <= visible_chars:
         return "*" * len(secret)
 
-    return "*" * (len(secret) - visible_chars) + secret[-visible_chars:]
+    # Pad the visible tail in one allocation. Slicing from the front keeps
+    # visible_chars=0 fully masked (secret[-0:] would be the whole secret).
+    return secret[len(secret) - visible_chars :].rjust(len(secret), "*")
 
 
 def validate_max_dispatches(value: Any) -> int:
@@ -41,6 +41,16 @@ F = TypeVar("F", bound=Callable[..., Any])
 _tracing_initialized = False
 _weave_available = False
 
+# WEAVE_DISABLED values (lower-cased) that turn tracing off
+_DISABLED_VALUES = frozenset(("true", "1", "yes"))
+
+# Lower-cased header names whose values are redacted before tracing
+_SENSITIVE_HEADER_KEYS = frozenset(("authorization", "api-key", "x-api-key", "bearer"))
+
+# Shared HTTP session so repeated LLM calls reuse pooled keep-alive connections
+# instead of paying a new TCP/TLS handshake each time.
+_SESSION = requests.Session()
+
 # Try to import weave
 try:
     import weave
@@ -61,7 +71,7 @@ def is_tracing_enabled() -> bool:
         return False
 
     disabled = os.getenv("WEAVE_DISABLED", "false").lower()
-    return disabled not in ("true", "1", "yes")
+    return disabled not in _DISABLED_VALUES
 
 
 def init_tracing(project_name: Optional[str] = None) -> bool:
@@ -108,7 +118,7 @@ def get_tracing_status() -> Dict[str, Any]:
         "tracing_enabled": is_tracing_enabled(),
         "tracing_initialized": _tracing_initialized,
         "project": os.getenv("WEAVE_PROJECT", "agent-hive"),
-        "disabled_by_env": os.getenv("WEAVE_DISABLED", "false").lower() in ("true", "1", "yes"),
+        "disabled_by_env": os.getenv("WEAVE_DISABLED", "false").lower() in _DISABLED_VALUES,
     }
 
 
@@ -170,7 +180,17 @@ class LLMCallMetadata:  # pylint: disable=too-few-public-methods,too-many-instan
         self.latency_ms = latency_ms
         self.success = success
         self.error = error
-        self.timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        # Capture the wall clock cheaply; formatting waits until someone reads it.
+        self._timestamp_ns = time.time_ns()
+
+    @property
+    def timestamp(self) -> str:
+        """UTC ISO-8601 timestamp of when the metadata was created."""
+        seconds, nanos = divmod(self._timestamp_ns, 1_000_000_000)
+        created = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+            microsecond=nanos // 1000
+        )
+        return created.isoformat().replace("+00:00", "Z")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary."""
@@ -198,8 +218,10 @@ def _sanitize_headers(headers: Dict[str, str]) -> Dict[str, str]:
     Returns:
         A new dictionary with sensitive values redacted.
     """
-    sensitive_keys = {"authorization", "api-key", "x-api-key", "bearer"}
-    return {k: "***REDACTED***" if k.lower() in sensitive_keys else v for k, v in headers.items()}
+    return {
+        k: "***REDACTED***" if k.lower() in _SENSITIVE_HEADER_KEYS else v
+        for k, v in headers.items()
+    }
 
 
 def _extract_token_usage(response_json: Dict[str, Any]) -> Dict[str, Optional[int]]:
@@ -255,8 +277,9 @@ def traced_llm_call(
     Raises:
         Does not raise exceptions - errors are captured in metadata.
     """
-    # If tracing is enabled, use the traced version with sanitized headers for logging
-    if is_tracing_enabled() and _tracing_initialized:
+    # If tracing is enabled, use the traced version with sanitized headers for logging.
+    # Check the initialized flag first so untraced processes skip the env lookup entirely.
+    if _tracing_initialized and is_tracing_enabled():
         # Sanitize headers for tracing to avoid logging API keys
         sanitized_headers = _sanitize_headers(headers)
         return _traced_llm_call_impl(
@@ -280,7 +303,7 @@ def _untraced_llm_call_impl(
     success = True
 
     try:
-        response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
+        response = _SESSION.post(api_url, headers=headers, json=payload, timeout=timeout)
         response.raise_for_status()
         response_json = response.json()
     except requests.exceptions.RequestException as e:
@@ -350,6 +373,27 @@ else:
         return _untraced_llm_call_impl(api_url, actual_headers, payload, model, timeout)
 
 
+def _deferred_weave_op(func: F, name: str) -> F:
+    """Wrap func so calls go through a weave op once tracing is initialized.
+
+    Tracing may be initialized after decoration, so the op is built on the first
+    traced call and then reused rather than re-wrapping func on every call.
+    """
+    traced: Optional[Callable[..., Any]] = None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal traced
+        if _tracing_initialized and _weave_available:
+            if traced is None:
+                traced = weave.op(func)
+                traced.name = name
+            return traced(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
 def traced_workspace_run(func: F) -> F:
     """Backward-compatible decorator to trace a full workspace sync or run.
 
@@ -361,17 +405,7 @@ def traced_workspace_run(func: F) -> F:
     """
     if not is_tracing_enabled():
         return func
-
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        if _tracing_initialized and _weave_available:
-            # Use weave.op for the wrapper
-            traced = weave.op(func)
-            traced.name = "workspace_run"
-            return traced(*args, **kwargs)
-        return func(*args, **kwargs)
-
-    return wrapper  # type: ignore
+    return _deferred_weave_op(func, "workspace_run")
 
 
 # Backward-compatible alias for older integrations.
@@ -389,16 +423,7 @@ def traced_analysis(func: F) -> F:
     """
     if not is_tracing_enabled():
         return func
-
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        if _tracing_initialized and _weave_available:
-            traced = weave.op(func)
-            traced.name = "context_build"
-            return traced(*args, **kwargs)
-        return func(*args, **kwargs)
-
-    return wrapper  # type: ignore
+    return _deferred_weave_op(func, "context_build")
 
 
 # Convenience function to check status
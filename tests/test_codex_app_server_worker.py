@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
 
 from src.hive.drivers.codex_app_server_worker import CodexAppServerBroker
@@ -163,3 +164,21 @@ def test_file_approval_imports_dedupe_by_server_request_id(
         "201",
         "202",
     ]
+
+
+def test_state_file_is_only_rewritten_when_state_changes(tmp_path: Path) -> None:
+    broker = _make_broker(tmp_path)
+    broker._handle_notification(
+        {"method": "turn/started", "params": {"turn": {"id": "turn_1", "status": "inProgress"}}}
+    )
+    state_path = tmp_path / "state.json"
+    first_inode = state_path.stat().st_ino
+
+    broker._handle_notification({"method": "item/agentMessage/delta", "params": {"delta": "hi"}})
+    assert state_path.stat().st_ino == first_inode
+
+    broker._handle_notification(
+        {"method": "thread/tokenUsage/updated", "params": {"tokenUsage": {"total": 12}}}
+    )
+    assert json.loads(state_path.read_text(encoding="utf-8"))["token_usage"] == {"total": 12}
+    assert not list(tmp_path.glob("state.json.tmp*"))
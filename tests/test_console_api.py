@@ -884,6 +884,48 @@ class TestObserveConsoleApi:
         assert console.status_code == 200
         assert "index-" in console.text
 
+    def test_home_view_lists_runs_once(self, temp_hive_dir, capsys, monkeypatch):
+        from src.hive.console import state as console_state
+
+        init_git_repo(temp_hive_dir)
+        _invoke_cli_json(
+            capsys,
+            ["--path", temp_hive_dir, "--json", "quickstart", "demo", "--title", "Demo"],
+        )
+        list_runs = console_state.list_runs
+        calls: list[Path] = []
+
+        def counting_list_runs(base_path, **kwargs):
+            calls.append(base_path)
+            return list_runs(base_path, **kwargs)
+
+        monkeypatch.setattr(console_state, "list_runs", counting_list_runs)
+
+        home = console_state.build_home_view(Path(temp_hive_dir))
+
+        assert home["recent_accepts"] == []
+        assert len(calls) == 1
+
+    def test_project_context_endpoint_syncs_workspace_once(
+        self, temp_hive_dir, capsys, monkeypatch
+    ):
+        init_git_repo(temp_hive_dir)
+        _invoke_cli_json(
+            capsys,
+            ["--path", temp_hive_dir, "--json", "onboard", "demo", "--title", "Demo"],
+        )
+        sync_calls: list[Path] = []
+        monkeypatch.setattr(
+            "src.hive.context_bundle.sync_workspace", lambda root: sync_calls.append(root)
+        )
+
+        client = TestClient(app)
+        context = client.get("/projects/demo/context", params={"path": temp_hive_dir})
+
+        assert context.status_code == 200
+        assert "HIVE STARTUP CONTEXT" in context.json()["rendered"]
+        assert sync_calls == []
+
     def test_console_routes_serve_the_react_bundle_when_assets_exist(self, temp_hive_dir):
         client = TestClient(app)
 
@@ -27,6 +27,7 @@ from context_assembler import (
     get_next_task,
     get_relevant_files_content,
 )
+from src.hive.context_bundle import generate_file_tree as render_file_tree
 from src.hive.migrate import migrate_v1_to_v2
 from src.hive.scheduler.query import ready_tasks
 
@@ -65,6 +66,74 @@ class TestGenerateFileTree:
             assert "__pycache__" not in tree
             assert "visible.txt" in tree
 
+    def test_renders_nested_branches_in_sorted_order(self):
+        """Directories sort first and nested branches keep their connector prefixes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "b_dir").mkdir()
+            (temp_path / "b_dir" / "inner.txt").write_text("x", encoding="utf-8")
+            (temp_path / "a_dir").mkdir()
+            (temp_path / "a_dir" / "deep").mkdir()
+            (temp_path / "a_dir" / "deep" / "too_deep.txt").write_text("x", encoding="utf-8")
+            (temp_path / "a_file.txt").write_text("x", encoding="utf-8")
+
+            tree = generate_file_tree(temp_path, max_depth=2)
+
+            assert tree == (
+                "├── a_dir\n"
+                "│   └── deep\n"
+                "├── b_dir\n"
+                "│   └── inner.txt\n"
+                "└── a_file.txt\n"
+            )
+
+    def test_expands_symlinked_directories(self):
+        """Symlinked directories sort with directories and their contents are listed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "real").mkdir()
+            (temp_path / "real" / "shared.py").write_text("x", encoding="utf-8")
+            (temp_path / "linked").symlink_to("real", target_is_directory=True)
+            (temp_path / "a_file.txt").write_text("x", encoding="utf-8")
+
+            tree = generate_file_tree(temp_path, max_depth=2)
+
+            assert tree == (
+                "├── linked\n"
+                "│   └── shared.py\n"
+                "├── real\n"
+                "│   └── shared.py\n"
+                "└── a_file.txt\n"
+            )
+
+    def test_truncates_once_entry_budget_is_spent(self):
+        """Large trees stop at the entry budget and say so."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for index in range(5):
+                (temp_path / f"file_{index}.txt").write_text("x", encoding="utf-8")
+
+            tree = render_file_tree(temp_path, max_entries=3)
+
+            assert tree.splitlines() == [
+                "├── file_0.txt",
+                "├── file_1.txt",
+                "├── file_2.txt",
+                "...(truncated)",
+            ]
+
+    def test_truncates_once_size_budget_is_spent(self):
+        """The character budget caps the rendered tree size."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for index in range(5):
+                (temp_path / f"file_{index}.txt").write_text("x", encoding="utf-8")
+
+            tree = render_file_tree(temp_path, max_chars=40)
+
+            assert tree.endswith("...(truncated)\n")
+            assert tree.count("file_") == 2
+
 
 class TestRelevantFiles:
     """Tests for get_relevant_files_content."""
@@ -255,6 +324,33 @@ class TestExternalRepoHelpers:
             assert "index.ts" in tree
             assert "package.json" in files_content
 
+    def test_get_external_repo_context_skips_noise_directories(self):
+        """Dependency and build directories are pruned from the repository tree."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for noisy in ("node_modules", "dist", ".venv"):
+                (temp_path / noisy).mkdir()
+                (temp_path / noisy / "ignored.js").write_text("x", encoding="utf-8")
+            (temp_path / "lib").mkdir()
+            (temp_path / "README.md").write_text("# Repo", encoding="utf-8")
+
+            tree, _ = get_external_repo_context(temp_path)
+
+            assert tree == "├── lib\n└── README.md\n"
+
+    def test_get_external_repo_context_expands_symlinked_directories(self):
+        """Symlinked directories in the clone are listed and walked like directories."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "pkg").mkdir()
+            (temp_path / "pkg" / "mod.py").write_text("x", encoding="utf-8")
+            (temp_path / "alias").symlink_to("pkg", target_is_directory=True)
+            (temp_path / "README.md").write_text("# Repo", encoding="utf-8")
+
+            tree, _ = get_external_repo_context(temp_path)
+
+            assert tree == "├── alias\n│   └── mod.py\n├── pkg\n│   └── mod.py\n└── README.md\n"
+
     def test_get_external_repo_context_with_custom_files(self):
         """Custom file selection overrides defaults."""
         with tempfile.TemporaryDirectory() as temp_dir:
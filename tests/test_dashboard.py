@@ -375,6 +375,7 @@ class TestGenerateDeepWorkContext:
         assert timestamp_str.endswith(
             "Z"
         ), f"Timestamp should end with 'Z' for UTC. Got: {timestamp_str}"
+        assert "." not in timestamp_str, "Generated stamps are second-precision"
 
     def test_generate_context_nonexistent_project(self, temp_hive_dir):
         """Test generating context for non-existent project."""
@@ -437,6 +438,19 @@ class TestDashboardIntegration:
         assert context is not None
         assert "test-project" in context
 
+    def test_context_reuses_discovered_project_data(self, temp_hive_dir, temp_project):
+        """Passing a discovered project dict skips re-reading AGENCY.md."""
+        base_path = Path(temp_hive_dir)
+        migrate_v1_to_v2(temp_hive_dir)
+        project = discover_projects(base_path)[0]
+
+        with patch.object(dashboard_module, "load_project") as load_mock:
+            context = generate_deep_work_context(project["path"], base_path, project=project)
+
+        load_mock.assert_not_called()
+        assert context is not None
+        assert "test-project" in context
+
     def test_multiple_projects_workflow(self, temp_hive_dir, temp_project, temp_blocked_project):
         """Test workflow with multiple projects."""
         base_path = Path(temp_hive_dir)
@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
-from src.hive.scheduler.query import dependency_summary, ready_tasks
+import sys
+
+from src.hive.scheduler.query import _find_project_cycles, dependency_summary, ready_tasks
 from src.hive.store.projects import create_project, get_project, save_project
 from src.hive.store.task_files import create_task, link_tasks
 
@@ -37,6 +39,14 @@ class TestGraphIntelligence:
         assert project_map["beta"]["in_cycle"] is True
         assert project_map["gamma"]["in_cycle"] is True
 
+    def test_project_cycle_detection_handles_chains_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 100
+        names = [f"p{index:05d}" for index in range(depth)]
+        graph = {name: {successor} for name, successor in zip(names, names[1:])}
+        graph[names[-1]] = {names[-2]}
+
+        assert _find_project_cycles(graph) == [[names[-2], names[-1], names[-2]]]
+
     def test_ready_tasks_promote_work_that_unblocks_more_of_the_graph(self, temp_hive_dir):
         create_project(temp_hive_dir, "demo", title="Demo")
         chain_root = create_task(temp_hive_dir, "demo", "Unblock the chain", status="ready", priority=2)
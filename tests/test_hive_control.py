@@ -23,7 +23,7 @@ from src.hive.control import (
     work_on_task,
 )
 from src.hive.store.projects import create_project
-from src.hive.store.task_files import claim_task, create_task, get_task
+from src.hive.store.task_files import claim_task, create_task, get_task, save_task
 
 
 def _invoke_cli_json(capsys, argv: list[str]) -> dict:
@@ -344,6 +344,35 @@ class TestHiveControlPlane:
         with pytest.raises(ValueError, match="actively claimed by alice"):
             work_on_task(temp_hive_dir, task_id=task_id, owner="bob")
 
+    def test_work_on_task_keeps_task_edits_made_during_checkpoint(
+        self, temp_hive_dir, capsys, monkeypatch
+    ):
+        """Task-file edits from checkpoint commit hooks should survive the claim."""
+        from src.hive.control import portfolio
+
+        init_git_repo(temp_hive_dir)
+        _invoke_cli_json(
+            capsys,
+            ["--path", temp_hive_dir, "--json", "quickstart", "demo", "--title", "Demo"],
+        )
+        write_safe_program(temp_hive_dir, "demo")
+        recommendation = recommend_next_task(temp_hive_dir, project_id="demo")
+        assert recommendation is not None
+        task_id = recommendation["task"]["id"]
+        real_checkpoint = portfolio.create_checkpoint_commit
+
+        def checkpoint_with_hook(root, *, message):
+            task = get_task(root, task_id)
+            task.labels = [*task.labels, "from-hook"]
+            save_task(root, task)
+            return real_checkpoint(root, message=message)
+
+        monkeypatch.setattr(portfolio, "create_checkpoint_commit", checkpoint_with_hook)
+
+        work_on_task(temp_hive_dir, task_id=task_id, owner="manager")
+
+        assert "from-hook" in get_task(temp_hive_dir, task_id).labels
+
     def test_work_on_task_validates_task_before_checkpoint(self, temp_hive_dir, capsys):
         """Mistyped task IDs should fail before creating a checkpoint commit."""
         init_git_repo(temp_hive_dir)
@@ -52,6 +52,13 @@ class TestHiveV2MCP:
         tools = await list_tools()
         assert [tool.name for tool in tools] == ["search", "execute"]
 
+    async def test_unknown_tool_returns_error_payload(self):
+        """Unknown tool names should fail softly with a descriptive error."""
+        response = await call_tool("list_projects", {})
+        payload = json.loads(response[0].text)
+        assert payload["success"] is False
+        assert payload["error"] == "Unknown tool: list_projects"
+
     async def test_search_tool_returns_workspace_results(
         self,
         temp_hive_dir,
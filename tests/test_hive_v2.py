@@ -12,6 +12,7 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 import importlib
 import json
+import os
 from pathlib import Path
 import sqlite3
 import subprocess
@@ -20,6 +21,7 @@ import sys
 import pytest
 
 from hive.cli.main import main as hive_main
+from src.hive import common as common_module
 from src.hive.cli.render import render_payload
 from src.hive.codemode.execute import MAX_EXECUTE_BYTES
 from src.hive.context_bundle import build_context_bundle
@@ -28,6 +30,7 @@ from src.hive.memory import observe_project, reflect_project, search_memory, sta
 from src.hive.migrate import migrate_v1_to_v2
 from src.hive.models.task import TaskRecord
 from src.hive.projections.agency_md import RUN_BEGIN, RUN_END, TASK_BEGIN, TASK_END
+from src.hive.projections.agency_md import sync_agency_md
 from src.hive.projections.global_md import BEGIN as GLOBAL_BEGIN
 from src.hive.projections.global_md import END as GLOBAL_END
 from src.hive.runs import accept_run, eval_run, start_run
@@ -37,8 +40,11 @@ from src.hive.search import search_console_workspace, search_workspace
 from src.hive.scheduler.query import project_summary, ready_tasks
 from src.hive.store.cache import _memory_scope_parts, rebuild_cache
 from src.hive.store.layout import ensure_layout, global_memory_dir, tasks_dir
-from src.hive.store.projects import discover_projects
+from src.hive.store import projects as project_store
+from src.hive.store import task_files as task_files_module
+from src.hive.store.projects import discover_projects, save_project
 from src.hive.store.task_files import (
+    claim_task,
     create_task,
     get_task,
     link_tasks,
@@ -202,6 +208,60 @@ class TestHiveV2TaskFiles:
         else:  # pragma: no cover - defensive
             raise AssertionError("Expected missing destination task to raise FileNotFoundError")
 
+    def test_claim_task_accepts_preloaded_task(self, temp_hive_dir, monkeypatch):
+        """Claiming an already loaded task should persist it without reloading the file."""
+        ensure_layout(temp_hive_dir)
+        task = TaskRecord(
+            id="task_test_preloaded_claim",
+            project_id="test-project",
+            title="Preloaded claim",
+            status="ready",
+        )
+        save_task(temp_hive_dir, task)
+        loaded = get_task(temp_hive_dir, task.id)
+        monkeypatch.setattr("src.hive.store.task_files.get_task", None)
+
+        claimed = claim_task(temp_hive_dir, task.id, "alice", task=loaded)
+        monkeypatch.undo()
+
+        assert claimed is loaded
+        reloaded = get_task(temp_hive_dir, task.id)
+        assert (reloaded.owner, reloaded.status) == ("alice", "claimed")
+        with pytest.raises(ValueError):
+            claim_task(temp_hive_dir, "task_other", "alice", task=reloaded)
+
+    def test_list_tasks_reuses_parse_until_task_file_changes(self, temp_hive_dir, monkeypatch):
+        """Repeated queue reads should not reparse unchanged task files."""
+        ensure_layout(temp_hive_dir)
+        task = TaskRecord(
+            id="task_test_cached_parse",
+            project_id="test-project",
+            title="Cached parse",
+            status="ready",
+            labels=["one"],
+        )
+        save_task(temp_hive_dir, task)
+        calls = []
+        original = task_files_module.safe_load_agency_md
+
+        def counting_load(path):
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(task_files_module, "safe_load_agency_md", counting_load)
+        first = list_tasks(temp_hive_dir)[0]
+        first.labels.append("mutated-in-memory")
+        second = list_tasks(temp_hive_dir)[0]
+
+        assert len(calls) == 1
+        assert second.labels == ["one"]
+
+        second.status = "blocked"
+        save_task(temp_hive_dir, second)
+
+        assert get_task(temp_hive_dir, task.id).status == "blocked"
+        assert len(calls) == 2
+
     def test_task_round_trip_preserves_noncanonical_sections(self, temp_hive_dir):
         """Custom task sections should survive load/save cycles."""
         ensure_layout(temp_hive_dir)
@@ -229,6 +289,118 @@ class TestHiveV2TaskFiles:
         assert "- docs/example.md" in rendered
 
 
+class TestHiveV2ProjectStore:
+    """Tests for AGENCY.md project discovery."""
+
+    def test_discover_projects_reuses_parse_until_file_changes(
+        self, temp_hive_dir, temp_project, monkeypatch
+    ):
+        """Unchanged AGENCY.md files should not be reparsed on every discovery."""
+        calls = []
+        original = project_store.safe_load_agency_md
+
+        def counting_load(path):
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(project_store, "safe_load_agency_md", counting_load)
+        first = discover_projects(temp_hive_dir)[0]
+        first.metadata["owner"] = "mutated-in-memory"
+        second = discover_projects(temp_hive_dir)[0]
+
+        assert len(calls) == 1
+        assert second.metadata["owner"] is None
+
+        second.metadata["status"] = "paused"
+        save_project(second)
+        third = discover_projects(temp_hive_dir)[0]
+
+        assert len(calls) == 2
+        assert third.metadata["status"] == "paused"
+
+    def test_get_project_by_slug_loads_only_that_project(
+        self, temp_hive_dir, temp_project, monkeypatch
+    ):
+        """Slug and path lookups should not parse every AGENCY.md in the workspace."""
+        other_dir = Path(temp_hive_dir) / "projects" / "other-project"
+        other_dir.mkdir(parents=True)
+        (other_dir / "AGENCY.md").write_text(
+            "---\nproject_id: other-project\n---\n\n# Other\n", encoding="utf-8"
+        )
+        loaded = []
+        original = project_store.safe_load_agency_md
+
+        def recording_load(path):
+            loaded.append(Path(path).parent.name)
+            return original(path)
+
+        monkeypatch.setattr(project_store, "safe_load_agency_md", recording_load)
+
+        by_slug = project_store.get_project(temp_hive_dir, "other-project")
+        by_path = project_store.get_project(temp_hive_dir, "projects/other-project/AGENCY.md")
+
+        assert by_slug.id == by_path.id == "other-project"
+        assert by_slug.agency_path == by_path.agency_path
+        assert loaded == ["other-project"]
+        with pytest.raises(FileNotFoundError):
+            project_store.get_project(temp_hive_dir, "../projects/missing")
+
+    def test_write_agency_document_replaces_atomically(
+        self, temp_hive_dir, temp_project, monkeypatch
+    ):
+        """A failed write should leave the original AGENCY.md and no temp files behind."""
+        agency_path = Path(temp_project)
+        original = agency_path.read_text(encoding="utf-8")
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(common_module.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            project_store.write_agency_document(agency_path, "---\nproject_id: x\n---\n")
+        monkeypatch.undo()
+
+        assert agency_path.read_text(encoding="utf-8") == original
+        assert not list(agency_path.parent.glob("AGENCY.md.tmp*"))
+
+        project_store.write_agency_document(agency_path, "---\nproject_id: x\n---\n")
+        assert agency_path.read_text(encoding="utf-8") == "---\nproject_id: x\n---\n"
+        assert not list(agency_path.parent.glob("AGENCY.md.tmp*"))
+
+    def test_write_agency_document_writes_through_symlinks(self, temp_hive_dir, temp_project):
+        """A symlinked AGENCY.md should stay a link while its target receives the new text."""
+        agency_path = Path(temp_project)
+        real_path = agency_path.with_name("AGENCY.real.md")
+        agency_path.rename(real_path)
+        agency_path.symlink_to(real_path.name)
+
+        project_store.write_agency_document(agency_path, "---\nproject_id: x\n---\n")
+
+        assert agency_path.is_symlink()
+        assert real_path.read_text(encoding="utf-8") == "---\nproject_id: x\n---\n"
+        assert not list(agency_path.parent.glob("AGENCY*.tmp*"))
+
+    def test_write_agency_document_preserves_file_mode(self, temp_hive_dir, temp_project):
+        """Rewriting AGENCY.md should keep the permission bits of the original file."""
+        agency_path = Path(temp_project)
+        agency_path.chmod(0o600)
+
+        project_store.write_agency_document(agency_path, "---\nproject_id: x\n---\n")
+
+        assert agency_path.stat().st_mode & 0o777 == 0o600
+
+    def test_sync_agency_md_skips_unchanged_documents(self, temp_hive_dir, temp_project):
+        """Re-syncing identical rollups should not rewrite AGENCY.md."""
+        ensure_layout(temp_hive_dir)
+        agency_path = Path(temp_project)
+        sync_agency_md(temp_hive_dir)
+        first_mtime = agency_path.stat().st_mtime_ns
+        os.utime(agency_path, ns=(first_mtime - 10**9, first_mtime - 10**9))
+
+        assert sync_agency_md(temp_hive_dir) == [agency_path]
+        assert agency_path.stat().st_mtime_ns == first_mtime - 10**9
+
+
 class TestHiveV2Migration:
     """Tests for v1 -> v2 migration."""
 
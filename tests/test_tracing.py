@@ -6,6 +6,7 @@
 import sys
 import os
 import json
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -116,6 +117,17 @@ class TestLLMCallMetadata:
         assert metadata.error is None
         assert metadata.timestamp is not None
 
+    def test_metadata_timestamp_is_utc_iso_format(self):
+        """Test the lazily formatted timestamp is stable UTC ISO-8601."""
+        before = datetime.now(timezone.utc)
+        metadata = LLMCallMetadata(model="test-model", api_url="https://api.test.com")
+        after = datetime.now(timezone.utc)
+
+        assert metadata.timestamp.endswith("Z")
+        assert metadata.timestamp == metadata.to_dict()["timestamp"]
+        parsed = datetime.fromisoformat(metadata.timestamp.replace("Z", "+00:00"))
+        assert before.replace(microsecond=0) <= parsed <= after
+
     def test_metadata_with_all_fields(self):
         """Test metadata with all fields populated."""
         metadata = LLMCallMetadata(
@@ -343,7 +355,7 @@ class TestTracedLLMCall:
         }
         mock_response.raise_for_status = Mock()
 
-        with patch("tracing.requests.post", return_value=mock_response):
+        with patch("tracing._SESSION.post", return_value=mock_response):
             result = traced_llm_call(
                 api_url="https://api.test.com",
                 headers={"Authorization": "Bearer test"},
@@ -363,7 +375,7 @@ class TestTracedLLMCall:
 
         import requests
 
-        with patch("tracing.requests.post") as mock_post:
+        with patch("tracing._SESSION.post") as mock_post:
             mock_post.side_effect = requests.exceptions.ConnectionError("Failed to connect")
 
             result = traced_llm_call(
@@ -383,7 +395,7 @@ class TestTracedLLMCall:
 
         import requests
 
-        with patch("tracing.requests.post") as mock_post:
+        with patch("tracing._SESSION.post") as mock_post:
             mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
 
             result = traced_llm_call(
@@ -406,7 +418,7 @@ class TestTracedLLMCall:
         mock_response.json.return_value = {"choices": [{"message": {"content": "Hi"}}]}
         mock_response.raise_for_status = Mock()
 
-        with patch("tracing.requests.post", return_value=mock_response):
+        with patch("tracing._SESSION.post", return_value=mock_response):
             result = traced_llm_call(
                 api_url="https://api.test.com",
                 headers={},
@@ -426,7 +438,7 @@ class TestTracedLLMCall:
         mock_response.json.return_value = "Internal Server Error"
         mock_response.raise_for_status = Mock()
 
-        with patch("tracing.requests.post", return_value=mock_response):
+        with patch("tracing._SESSION.post", return_value=mock_response):
             result = traced_llm_call(
                 api_url="https://api.test.com",
                 headers={"Authorization": "Bearer test"},
@@ -451,7 +463,7 @@ class TestTracedLLMCall:
         mock_response.json.return_value = ["error1", "error2"]
         mock_response.raise_for_status = Mock()
 
-        with patch("tracing.requests.post", return_value=mock_response):
+        with patch("tracing._SESSION.post", return_value=mock_response):
             result = traced_llm_call(
                 api_url="https://api.test.com",
                 headers={"Authorization": "Bearer test"},
@@ -474,7 +486,7 @@ class TestTracedLLMCall:
         mock_response.json.return_value = 404
         mock_response.raise_for_status = Mock()
 
-        with patch("tracing.requests.post", return_value=mock_response):
+        with patch("tracing._SESSION.post", return_value=mock_response):
             result = traced_llm_call(
                 api_url="https://api.test.com",
                 headers={"Authorization": "Bearer test"},
@@ -495,7 +507,7 @@ class TestTracedLLMCall:
         mock_response.json.return_value = False
         mock_response.raise_for_status = Mock()
 
-        with patch("tracing.requests.post", return_value=mock_response):
+        with patch("tracing._SESSION.post", return_value=mock_response):
             result = traced_llm_call(
                 api_url="https://api.test.com",
                 headers={"Authorization": "Bearer test"},
@@ -534,6 +546,41 @@ class TestTraceOpDecorator:
         assert another_function() == "result"
 
 
+class TestTracedWorkspaceRun:
+    """Test the workspace and analysis tracing decorators."""
+
+    def test_weave_op_is_built_once_across_calls(self, monkeypatch):
+        """The traced op is created on the first traced call and then reused."""
+        import tracing
+
+        created = []
+
+        def fake_op(func):
+            def traced(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            created.append(traced)
+            return traced
+
+        monkeypatch.delenv("WEAVE_DISABLED", raising=False)
+        monkeypatch.setattr(tracing, "_weave_available", True)
+        monkeypatch.setattr(tracing, "weave", Mock(op=fake_op))
+        monkeypatch.setattr(tracing, "_tracing_initialized", False)
+
+        @tracing.traced_workspace_run
+        def run(x):
+            return x + 1
+
+        assert run(1) == 2
+        assert not created
+
+        monkeypatch.setattr(tracing, "_tracing_initialized", True)
+        assert run(2) == 3
+        assert run(3) == 4
+        assert len(created) == 1
+        assert created[0].name == "workspace_run"
+
+
 class TestInitTracing:
     """Test the init_tracing function."""
 
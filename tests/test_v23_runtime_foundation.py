@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 import subprocess
 from types import SimpleNamespace
@@ -13,6 +14,7 @@ from fastapi.testclient import TestClient
 import pytest
 
 from hive.cli.main import main as hive_main
+import src.hive.sandbox.registry as sandbox_registry
 import src.hive.sandbox.runtime as sandbox_runtime
 from src.hive.codemode.execute import execute_code
 from src.hive.console.api import app
@@ -300,6 +302,42 @@ def test_sandbox_doctor_lists_scaffolded_backends(capsys, temp_hive_dir):
     assert payload["backends"][-1]["experimental"] is True
 
 
+def test_backend_version_probe_reuses_output_until_binary_changes(monkeypatch, tmp_path):
+    backend = get_backend("asrt")
+    binary = tmp_path / "srt"
+    binary.write_text("#!/bin/sh\n", encoding="utf-8")
+    calls: list[list[str]] = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(list(argv))
+        return subprocess.CompletedProcess(argv, 0, stdout="srt 1.0.0\n", stderr="")
+
+    monkeypatch.setattr(type(backend), "_find_binary", lambda self: str(binary))
+    monkeypatch.setattr(sandbox_registry.subprocess, "run", fake_run)
+    monkeypatch.setattr(sandbox_registry, "_VERSION_OUTPUTS", {})
+
+    assert backend._command_output("--version") == "srt 1.0.0"
+    assert backend._command_output("--version") == "srt 1.0.0"
+    assert len(calls) == 1
+
+    stat = binary.stat()
+    os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert backend._command_output("--version") == "srt 1.0.0"
+    assert len(calls) == 2
+
+
+def test_host_mount_resolution_follows_the_current_directory(monkeypatch, tmp_path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    (first / "worktree").mkdir(parents=True)
+    (second / "worktree").mkdir(parents=True)
+
+    monkeypatch.chdir(first)
+    assert sandbox_runtime._resolve_host_path("worktree") == (first / "worktree").resolve()
+    monkeypatch.chdir(second)
+    assert sandbox_runtime._resolve_host_path("worktree") == (second / "worktree").resolve()
+
+
 def test_e2b_probe_reports_auth_unverified_without_env(monkeypatch):
     backend = get_backend("e2b")
 
@@ -753,6 +791,9 @@ def test_local_executor_wraps_commands_for_container_sandbox(monkeypatch, tmp_pa
         return Result()
 
     monkeypatch.setattr("src.hive.runs.executors.subprocess.run", fake_run)
+    monkeypatch.setattr(
+        sandbox_runtime, "_RESOLVED_BACKEND_BINARIES", {"podman": "/usr/bin/podman"}
+    )
     executor = LocalExecutor(
         SandboxPolicy(
             backend="podman",
@@ -781,7 +822,7 @@ def test_local_executor_wraps_commands_for_container_sandbox(monkeypatch, tmp_pa
     assert result.sandbox["backend"] == "podman"
     assert result.sandbox["network_mode"] == "deny"
     assert calls[0]["kwargs"]["shell"] is False
-    assert argv[:4] == ["podman", "run", "--rm", "--interactive"]
+    assert argv[:4] == ["/usr/bin/podman", "run", "--rm", "--interactive"]
     assert "--network" in argv
     assert "none" in argv
     assert "/workspace" in " ".join(argv)
@@ -2854,6 +2895,7 @@ def test_execute_local_safe_wraps_python_runner_in_container(monkeypatch, tmp_pa
     monkeypatch.setattr(type(podman), "probe", fake_podman_probe)
     monkeypatch.setattr(type(docker), "probe", fake_docker_probe)
     monkeypatch.setattr("src.hive.codemode.execute.subprocess.run", fake_run)
+    monkeypatch.setattr(sandbox_runtime, "_RESOLVED_BACKEND_BINARIES", {})
 
     payload = execute_code(
         workspace,
@@ -2870,7 +2912,7 @@ def test_execute_local_safe_wraps_python_runner_in_container(monkeypatch, tmp_pa
     assert payload["sandbox_network_mode"] == "deny"
     assert calls[0]["kwargs"]["shell"] is False
     assert calls[0]["kwargs"]["env"] is None
-    assert argv[0] == "podman"
+    assert argv[0] == "/tmp/podman"
     assert "python -m src.hive.codemode.python_runner" in argv[-1]
     assert "/artifacts/payload.json" in argv[-1]
 